@@ -1,6 +1,8 @@
 import json
 import shutil
 import subprocess
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -168,3 +170,45 @@ def extract_meta(path: Path) -> dict:
         "lens": lens,
         "kind": kind,
     }
+
+
+# Columns a MetaTable stores, in the same terms as the extract_meta keys
+META_COLUMNS = ("date", "year", "month", "camera", "lens", "kind")
+
+@dataclass
+class MetaTable:
+    """
+    Column-oriented scan metadata (one row per file, aligned with `paths`).
+    Values are interned, so the thousands of repeats of a camera or date share one string
+    instead of each file carrying its own dict.
+    """
+    paths: list[Path] = field(default_factory=list)
+    date: list[str] = field(default_factory=list)
+    year: list[str] = field(default_factory=list)
+    month: list[str] = field(default_factory=list)
+    camera: list[str] = field(default_factory=list)
+    lens: list[str] = field(default_factory=list)
+    kind: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def append(self, meta: dict):
+        """Add one extract_meta() result."""
+        self.paths.append(meta["path"])
+        for name in META_COLUMNS:
+            getattr(self, name).append(sys.intern(meta[name]))
+
+    def extend(self, other: "MetaTable"):
+        self.paths.extend(other.paths)
+        for name in META_COLUMNS:
+            getattr(self, name).extend(getattr(other, name))
+
+    def column(self, token: str) -> list[str]:
+        """Folder-name values for a structure token ("ext" is derived from the path)."""
+        key = token.lower()
+        if key in META_COLUMNS:
+            return [v or "Unknown" for v in getattr(self, key)]
+        if key == "ext":
+            return [p.suffix.lower().replace('.', '') or "Unknown" for p in self.paths]
+        return ["Unknown"] * len(self.paths)
@@ -1,8 +1,15 @@
 import os
 import csv
+import threading
 from pathlib import Path
 from PIL import Image, ExifTags
 
+# Ratings are written from the window's rating executor while the GUI thread reads them.
+# One lock serializes every read and read-modify-write; writes also go through a temp
+# file + os.replace so a reader never sees a half-written CSV.
+_FILE_LOCK = threading.Lock()
+HEADER = ["Filename", "Rating", "Date", "Camera"]
+
 class RatingManager:
     def __init__(self, folder_path: Path):
         self.folder_path = folder_path
@@ -10,12 +17,23 @@ class RatingManager:
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
-        if not self.ratings_file.exists():
-            with open(self.ratings_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Filename", "Rating", "Date", "Camera"])
+        with _FILE_LOCK:
+            if not self.ratings_file.exists():
+                self._write_rows([HEADER])
+
+    def _write_rows(self, rows):
+        # Caller holds _FILE_LOCK
+        tmp = self.ratings_file.with_name(self.ratings_file.name + ".tmp")
+        with open(tmp, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerows(rows)
+        os.replace(tmp, self.ratings_file)
 
     def save_rating(self, filename: str, rating: int, date: str = "", camera: str = ""):
+        with _FILE_LOCK:
+            self._save_rating(filename, rating, date, camera)
+
+    def _save_rating(self, filename: str, rating: int, date: str, camera: str):
         rows = []
         updated = False
         
@@ -38,11 +56,13 @@ class RatingManager:
             rows.append([filename, str(rating), date, camera])
 
         # Write back
-        with open(self.ratings_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(rows)
+        self._write_rows(rows)
 
     def load_ratings(self) -> list[dict]:
+        with _FILE_LOCK:
+            return self._load_ratings()
+
+    def _load_ratings(self) -> list[dict]:
         ratings = []
         if self.ratings_file.exists():
             try:
@@ -80,6 +100,10 @@ class RatingManager:
 
     def remove_rating(self, filename: str):
         """Remove the rating for a specific file."""
+        with _FILE_LOCK:
+            self._remove_rating(filename)
+
+    def _remove_rating(self, filename: str):
         rows = []
         if self.ratings_file.exists():
             with open(self.ratings_file, 'r', newline='', encoding='utf-8') as f:
@@ -91,15 +115,12 @@ class RatingManager:
                     if len(row) > 0 and row[0] == filename:
                         continue  # Skip this row (remove rating)
                     rows.append(row)
-        with open(self.ratings_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(rows)
+        self._write_rows(rows)
 
     def clear_all_ratings(self):
         """Remove all ratings (reset CSV to just header)."""
-        with open(self.ratings_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(["Filename", "Rating", "Date", "Camera"])
+        with _FILE_LOCK:
+            self._write_rows([HEADER])
 
 def get_image_metadata(path: Path):
     date_str = ""
@@ -1,23 +1,93 @@
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Generator, Callable
 
-from .metadata import extract_meta, RAW_EXT
-from .utils import file_hash, unique_dest
+import numpy as np
+
+from .metadata import extract_meta, RAW_EXT, MetaTable
+from .utils import file_hash, file_digest, unique_dest
 
 IMAGE_EXT = {
     ".jpg", ".jpeg", ".png", ".heic", ".heif", ".tif", ".tiff",
     ".arw", ".cr2", ".cr3", ".nef", ".orf", ".rw2", ".raf", ".dng", ".srw", ".pef"
 }
 
+# Below this many files the process pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+# Files per task handed to a pool process
+PARALLEL_BATCH = 64
+
+def _extract_batch(paths: list[Path]) -> list[dict]:
+    """Pool task: metadata for a batch of files (module level so it pickles)."""
+    return [extract_meta(p) for p in paths]
+
+class SortCancelled(Exception):
+    """Raised out of Sorter.scan / execute_sort once Sorter.cancel() was called."""
+
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
 def walk_images(root: Path) -> Generator[Path, None, None]:
     """Traverse all image files under the root folder."""
-    for dp, _, fns in os.walk(root):
-        for fn in fns:
-            p = Path(dp) / fn
-            if p.suffix.lower() in IMAGE_EXT:
-                yield p
+    if os.scandir in os.supports_fd:
+        try:
+            root_fd = os.open(root, _DIR_FLAGS)
+        except OSError:
+            return
+        try:
+            yield from _walk_images_fd(root_fd, os.fspath(root))
+        finally:
+            os.close(root_fd)
+        return
+
+    # scandir exposes d_type, so directory/file checks need no extra stat,
+    # and non-images are filtered on the name before any Path is built.
+    stack = [os.fspath(root)]
+    while stack:
+        top = stack.pop()
+        try:
+            it = os.scandir(top)
+        except OSError:
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in IMAGE_EXT:
+                    yield Path(entry.path)
+        # Reverse so folders are visited in listing order, like os.walk
+        stack.extend(reversed(subdirs))
+
+def _walk_images_fd(dir_fd: int, dirpath: str) -> Generator[Path, None, None]:
+    """walk_images over directory fds: subfolders are opened relative to their parent
+    (openat) so the kernel never re-resolves the full path. Open fds = tree depth."""
+    subdirs = []
+    with os.scandir(dir_fd) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                    continue
+            except OSError:
+                continue
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXT:
+                yield Path(os.path.join(dirpath, entry.name))
+
+    for name in subdirs:
+        try:
+            fd = os.open(name, _DIR_FLAGS, dir_fd=dir_fd)
+        except OSError:
+            continue
+        try:
+            yield from _walk_images_fd(fd, os.path.join(dirpath, name))
+        finally:
+            os.close(fd)
 
 class Sorter:
     def __init__(self, config: dict):
@@ -27,78 +97,150 @@ class Sorter:
         self.action = config.get("action", "copy")  # copy | move
         self.policy = config.get("policy", "ask")
         self.skip_hash = config.get("skip_hash_dup", False)
+        self.workers = config.get("workers", 1) or 1
+        self._cancelled = False # set from another thread by cancel()
 
         self.preview_plan: dict[Path, list[Path]] = {}
         self.conflicts: list[tuple[Path, Path]] = []
 
-    def scan(self, src_root: Path, progress_cb: Callable[[int, int], None] | None = None) -> tuple[list[Path], list[dict]]:
-        files = list(walk_images(src_root))
-        metas = []
-        total = len(files)
+    def cancel(self) -> None:
+        """Ask a running scan/sort (on another thread) to stop at the next file."""
+        self._cancelled = True
+
+    def scan(self, src_root: Path, progress_cb: Callable[[int, int], None] | None = None,
+             chunk_cb: Callable[[list[Path], MetaTable], None] | None = None,
+             chunk_size: int = 512) -> tuple[list[Path], MetaTable]:
+        """
+        Extract metadata for every image under src_root.
+        chunk_cb: callback(files_chunk, metas_chunk), called every chunk_size files
+        so callers can show partial results before the whole tree is done.
+        The returned files list is row-aligned with the MetaTable (completion order
+        when a process pool is used).
+        """
+        found = []
+        for f in walk_images(src_root):
+            if self._cancelled: raise SortCancelled()
+            found.append(f)
+        if self.skip_hash:
+            found = self._drop_content_duplicates(found)
+        files = []
+        metas = MetaTable()
+        chunk = MetaTable()
+        total = len(found)
+        chunk_start = 0
         
-        for idx, f in enumerate(files):
-            meta = extract_meta(f)
-            metas.append(meta)
-            if progress_cb:
-                progress_cb(idx + 1, total)
+        # Metadata parsing is CPU bound per file; fan it out over processes
+        pool = None
+        if self.workers > 1 and total >= PARALLEL_MIN_FILES:
+            pool = ProcessPoolExecutor(max_workers=self.workers)
+            futures = {
+                pool.submit(_extract_batch, found[i:i + PARALLEL_BATCH]): found[i:i + PARALLEL_BATCH]
+                for i in range(0, total, PARALLEL_BATCH)
+            }
+            # Take batches as they finish so one slow file doesn't hold back progress
+            batches = ((futures[fut], fut.result()) for fut in as_completed(futures))
+        else:
+            batches = (([f], [extract_meta(f)]) for f in found)
+        
+        try:
+            for paths, batch in batches:
+                if self._cancelled: raise SortCancelled()
+                files.extend(paths)
+                for meta in batch:
+                    chunk.append(meta)
+                done = len(files)
+                if progress_cb:
+                    progress_cb(done, total)
+                if done - chunk_start >= chunk_size or done == total:
+                    metas.extend(chunk)
+                    if chunk_cb:
+                        chunk_cb(files[chunk_start:done], chunk)
+                    chunk = MetaTable()
+                    chunk_start = done
+        finally:
+            if pool:
+                # On cancel don't wait for batches already running in the pool
+                pool.shutdown(wait=not self._cancelled, cancel_futures=True)
         
         return files, metas
 
-    def plan_sort(self, files: list[Path], metas: list[dict]) -> dict[Path, list[Path]]:
+    def _drop_content_duplicates(self, files: list[Path]) -> list[Path]:
+        """Keep only the first file for each content digest."""
+        seen = set()
+        unique = []
+        for f in files:
+            if self._cancelled: raise SortCancelled()
+            digest = file_digest(f)
+            if digest:
+                if digest in seen:
+                    continue
+                seen.add(digest)
+            unique.append(f)
+        return unique
+
+    def group(self, metas: MetaTable) -> dict[Path, list[Path]]:
+        """
+        Bucket files by self.structure without touching self.preview_plan.
+        Each structure column is factorized to integer codes and the rows are ordered with
+        one np.lexsort; folders are the runs of equal code tuples.
+        """
+        n = len(metas)
+        if n == 0:
+            return {}
+        if not self.structure:
+            return {self.dest_root: list(metas.paths)}
+
+        uniques = []
+        codes = []
+        for token in self.structure:
+            u, inv = np.unique(np.array(metas.column(token), dtype=object), return_inverse=True)
+            uniques.append(u)
+            codes.append(inv)
+
+        # lexsort keys are last-primary, and it is stable so scan order survives inside a folder
+        order = np.lexsort(codes[::-1])
+        keys = np.stack([c[order] for c in codes])
+        bounds = np.flatnonzero(np.any(keys[:, 1:] != keys[:, :-1], axis=0)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [n]))
+
+        paths = metas.paths
+        plan = {}
+        for s, e in zip(starts, ends):
+            current_dir = self.dest_root
+            for u, c in zip(uniques, keys[:, s]):
+                current_dir = current_dir / u[c]
+            plan[current_dir] = [paths[i] for i in order[s:e]]
+        return plan
+
+    def plan_sort(self, files: list[Path], metas: MetaTable) -> dict[Path, list[Path]]:
         """
         Generate a plan based on self.structure.
         structure example: ["year", "camera", "kind"] -> dest/2023/Canon/raw/file.ext
         """
-        plan = {}
         self.conflicts = []
-
-        for meta in metas:
-            src_path = meta["path"]
-            
-            # Build target directory
-            current_dir = self.dest_root
-            
-            for token in self.structure:
-                val = ""
-                key = token.lower()
-                
-                if key == "date":
-                    val = meta.get("date", "Unknown Date")
-                elif key == "year":
-                    val = meta.get("year", "Unknown Year")
-                elif key == "month":
-                    # meta["month"] comes as YYYY-MM usually
-                    val = meta.get("month", "Unknown Month")
-                elif key == "camera":
-                    val = meta.get("camera", "Unknown Camera")
-                elif key == "lens":
-                    val = meta.get("lens", "Unknown Lens")
-                elif key == "kind":
-                    # kind is raw, jpg, other
-                    val = meta.get("kind", "other")
-                elif key == "ext":
-                     # extension grouping .jpg, .arw
-                     val = meta["path"].suffix.lower().replace('.', '')
-                
-                # Sanitize to be safe for folder name
-                # (meta values are already sanitized in metadata.py but double check empty)
-                if not val: val = "Unknown"
-                
-                current_dir = current_dir / val
-            
-            if current_dir not in plan:
-                plan[current_dir] = []
-            plan[current_dir].append(src_path)
+        plan = self.group(metas)
             
         self.preview_plan = plan
         return plan
 
+    def prepare_dirs(self, plan: dict[Path, list[Path]]) -> None:
+        """Create every destination folder once, parents first (sorted order)."""
+        for dest_dir in sorted(plan):
+            try:
+                os.makedirs(dest_dir, exist_ok=True)
+            except OSError:
+                # execute_sort reports the folder's files as errors when it can't list it
+                pass
+
     def execute_sort(self, plan: dict[Path, list[Path]], 
                      progress_cb: Callable[[str, int, int], None] | None = None,
-                     ask_cb: Callable[[Path, Path], str] | None = None) -> dict:
+                     ask_cb: Callable[[Path, Path], str] | None = None,
+                     dirs_ready: bool = False) -> dict:
         """
         Execute the plan.
         ask_cb: callback(src, dst) -> 'rename' | 'skip' | 'overwrite'
+        dirs_ready: destination folders were already created by prepare_dirs()
         """
         results = {"success": 0, "skipped": 0, "errors": 0}
         total_files = sum(len(srcs) for srcs in plan.values())
@@ -106,7 +248,12 @@ class Sorter:
 
         for dest_dir, srcs in plan.items():
             try:
-                dest_dir.mkdir(parents=True, exist_ok=True)
+                if not dirs_ready:
+                    dest_dir.mkdir(parents=True, exist_ok=True)
+                # One listing per folder instead of an exists() stat per file
+                existing = set(os.listdir(dest_dir))
+                # Case-folded names catch collisions on case-insensitive filesystems (Windows, macOS)
+                existing_folded = {name.casefold() for name in existing}
             except Exception as e:
                 # Log error?
                 results["errors"] += len(srcs)
@@ -114,11 +261,18 @@ class Sorter:
                 continue
 
             for src in srcs:
+                if self._cancelled: raise SortCancelled()
                 processed += 1
                 dst = dest_dir / src.name
+                if src.name in existing:
+                    dst_exists = True
+                elif src.name.casefold() in existing_folded:
+                    dst_exists = dst.exists() # differs only by case; let the filesystem decide
+                else:
+                    dst_exists = False
 
                 # Hash check
-                if self.skip_hash and dst.exists():
+                if self.skip_hash and dst_exists:
                     if file_hash(src) == file_hash(dst):
                         results["skipped"] += 1
                         if progress_cb: progress_cb(f"Skipped (hash): {src.name}", processed, total_files)
@@ -126,7 +280,7 @@ class Sorter:
 
                 # Policy check
                 decision = self.policy
-                if dst.exists():
+                if dst_exists:
                     if self.policy == "ask" and ask_cb:
                         decision = ask_cb(src, dst)
                     
@@ -142,6 +296,8 @@ class Sorter:
                         shutil.move(str(src), str(dst))
                     else:
                         shutil.copy2(str(src), str(dst))
+                    existing.add(dst.name)
+                    existing_folded.add(dst.name.casefold())
                     results["success"] += 1
                     if progress_cb: progress_cb(f"Processed: {src.name}", processed, total_files)
                 except Exception as e:
@@ -2,6 +2,12 @@ import os
 import hashlib
 from pathlib import Path
 
+try:
+    import blake3
+    BLAKE3_OK = True
+except Exception:
+    BLAKE3_OK = False
+
 def sanitize(name: str) -> str:
     """Sanitize a string so it is safe for use as a folder or file name."""
     if not name:
@@ -39,3 +45,14 @@ def file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
         return sha1.hexdigest()
     except Exception:
         return ""
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Content digest for duplicate detection (BLAKE3 if available, else BLAKE2b), streamed."""
+    h = blake3.blake3() if BLAKE3_OK else hashlib.blake2b()
+    try:
+        with open(path, "rb", buffering=0) as f:
+            while buf := f.read(chunk_size):
+                h.update(buf)
+        return h.hexdigest()
+    except Exception:
+        return ""
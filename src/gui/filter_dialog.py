@@ -3,7 +3,6 @@ from PySide6.QtWidgets import (
     QPushButton, QListWidget, QListWidgetItem, QCheckBox
 )
 from PySide6.QtCore import Qt
-from .styles import DARK_STYLE
 
 class FilterDialog(QDialog):
     def __init__(self, parent, rating_manager):
@@ -11,7 +10,6 @@ class FilterDialog(QDialog):
         self.setWindowTitle("Filter Images")
         self.resize(400, 500)
         self.rating_manager = rating_manager
-        self.setStyleSheet(DARK_STYLE)
         
         self.filtered_files = [] # Result
 
@@ -11,16 +11,17 @@ from PySide6.QtCore import (
 )
 from PySide6.QtGui import (
     QImage, QPixmap, QDrag, QPainter, QColor, QPen, QShortcut, QKeySequence, QIcon,
-    QDesktopServices
+    QDesktopServices, QPixmapCache
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QListWidget, QListWidgetItem, QLabel,
     QMessageBox, QScrollArea, QSlider, QSplitter,
     QGraphicsOpacityEffect, QFrame, QGraphicsDropShadowEffect, QStyle, QRubberBand,
-    QSizePolicy, QDialog, QDialogButtonBox, QTextEdit, QStackedWidget, QTreeWidget, QProgressBar
+    QSizePolicy, QDialog, QDialogButtonBox, QTextEdit, QStackedWidget, QTreeView, QProgressBar
 )
 from PIL import Image
+import numpy as np
 
 # Core imports (adjust as needed for your project structure)
 from ..core.image_loader import load_pil_image
@@ -31,16 +32,75 @@ from .organizer_dialog import OrganizerWidget
 from .organizer_dialog import OrganizerWidget
 from .filter_dialog import FilterDialog
 from .viewer_widget import FullViewerWidget
-from .styles import DARK_STYLE
 from ..core.rating_manager import RatingManager, get_image_metadata
 
 SUPPORTED_EXT = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.gif', '.heic', '.heif', '.arw', '.cr2', '.cr3', '.nef', '.rw2', '.orf', '.raf', '.dng'}
 RAW_EXT = {'.arw', '.cr2', '.cr3', '.nef', '.rw2', '.orf', '.raf', '.dng'}
 PROC_EXT = {'.jpg', '.jpeg', '.png', '.heic', '.heif'}
+VIEWER_PREFETCH_RADIUS = 2  # decode current ± this many rows ahead of navigation
+SIDECAR_EXT = {'.xmp', '.xml'}
+RATING_KEYS = {Qt.Key_1: 1, Qt.Key_2: 2, Qt.Key_3: 3, Qt.Key_4: 4, Qt.Key_5: 5}
+
+# Help text (static, built once at import)
+_HELP_EN = (
+    "※ Program Usage Guide\n\n"
+    "■ Mode: Image Grid (Default)\n"
+    "- Left Panel: Shows thumbnails of images in the selected folder.\n"
+    "- Right Panel: Shows two preview slots (Slot 1 & Slot 2).\n"
+    "- Click a thumbnail to view in Slot 1.\n"
+    "- Ctrl + Click a thumbnail to view in Slot 2.\n"
+    "- Use 'Dual Mode' to detach the right panel into a separate window.\n"
+    "- Use 'Independent Zoom' to toggle linked zooming between slots.\n"
+    "- Drag and Drop images to Target1/Target2 labels at bottom right.\n\n"
+    "■ Mode: Organize Photos\n"
+    "- Click 'Organize Photos' to switch to this mode.\n"
+    "- Left Panel: Settings for sorting (Source, Destination, Grouping, Action).\n"
+    "- Slot 1 (Top Right): Shows the preview tree of how files will be organized.\n"
+    "- Slot 2 (Bottom Right): Shows execution logs and progress.\n"
+    "- Click 'Scan' to analyze files, then 'Start' to execute the move/copy.\n"
+    "- Navigating to 'Image Folder' or 'Targets' will automatically exit this mode.\n\n"
+    "■ Shortcuts\n"
+    "- 1 / 2 + Click: Move to Target 1 / 2\n"
+    "- Ctrl+Z: Undo Move\n"
+    "- Ctrl+Y: Redo Move\n"
+    "- Ctrl+D: Toggle Dual Mode\n"
+    "- Ctrl+Scroll: Resize Thumbnails\n"
+)
+
+_HELP_KO = (
+    "※ 프로그램 사용 안내\n\n"
+    "■ 모드: 이미지 그리드 (기본)\n"
+    "- 왼쪽 패널: 선택된 폴더의 이미지 썸네일을 표시합니다.\n"
+    "- 오른쪽 패널: 두 개의 프리뷰 슬롯(Slot 1, Slot 2)을 보여줍니다.\n"
+    "- 썸네일 클릭: Slot 1 상단 프리뷰에 표시\n"
+    "- Ctrl + 클릭: Slot 2 하단 프리뷰에 표시\n"
+    "- '듀얼 모드' 버튼으로 오른쪽 패널을 별도 창으로 분리할 수 있습니다.\n"
+    "- '독립 줌 모드'로 두 슬롯의 줌 연결을 켜고 끌 수 있습니다.\n"
+    "- 우측 하단의 Target1/Target2 라벨로 이미지를 드래그하여 이동할 수 있습니다.\n\n"
+    "■ 모드: 사진 정리 (Organize Photos)\n"
+    "- '사진 정리' 버튼을 누르면 정리 모드로 전환됩니다.\n"
+    "- 왼쪽 패널: 분류 설정 (원본/대상 폴더, 그룹 방식, 이동/복사 등).\n"
+    "- Slot 1 (우측 상단): 스캔 후 파일이 어떻게 정리될지 트리 구조로 미리 보여줍니다.\n"
+    "- Slot 2 (우측 하단): 실행 로그와 진행률을 표시합니다.\n"
+    "- 'Scan'을 눌러 분석 후, 'Start'를 눌러 실행하세요.\n"
+    "- 'Image Folder'나 타겟 폴더 버튼을 누르면 자동으로 정리 모드가 종료됩니다.\n\n"
+    "■ 단축키\n"
+    "- 1 / 2 + 클릭: Target 1 / 2 로 이동\n"
+    "- Ctrl+Z: 이동 취소 (Undo)\n"
+    "- Ctrl+Y: 다시 실행 (Redo)\n"
+    "- Ctrl+D: 듀얼 모드 토글\n"
+    "- Ctrl+휠: 썸네일 크기 조절\n"
+)
+
 
 class GridSelectorWindow(QMainWindow):
-    thumbnail_loaded = Signal(str, QImage)
-    preview_ready = Signal(str, int, QImage) # Path, Slot, Image
+    # Images cross threads as `object` so the receiver gets the very QImage wrapper that
+    # holds its pixel buffer (pil_to_qimage(copy=False)); a QImage-typed signal would hand
+    # over a new wrapper and the worker-side buffer could be freed under it.
+    thumbnail_loaded = Signal(str, object) # Path, QImage
+    preview_ready = Signal(str, int, object) # Path, Slot, QImage
+    viewer_prefetched = Signal(str, object) # Path, QImage (null on failure)
+    rating_failed = Signal(str, int) # Path, rating to restore
 
     def __init__(self):
         super().__init__()
@@ -99,9 +159,18 @@ class GridSelectorWindow(QMainWindow):
         self.key_down_target: int | None = None
         self.moved_during_key_down: bool = False
 
+        # Key press coalescing (rating / move keys queued within one event-loop pass)
+        self._pending_rate: int | None = None
+        self._pending_move_target: int | None = None
+        self._key_flush_armed: bool = False
+
         self.thumb_thread: QThread | None = None
         # self.thumb_worker removed (deprecated)
 
+        # Row-aligned array of item paths (Qt.UserRole), maintained alongside list_widget
+        self._row_paths: np.ndarray = np.empty(0, dtype=object)
+
+        # Each entry is the (src, dest) op list exactly as it was executed
         self.undo_stack: list[list[tuple[Path, Path]]] = []
         self.redo_stack: list[list[tuple[Path, Path]]] = []
 
@@ -150,6 +219,11 @@ class GridSelectorWindow(QMainWindow):
         self.dual_mode_enabled: bool = False
         self.dual_window: QMainWindow | None = None
 
+        # Help dialog (created lazily on first show_help)
+        self._help_dialog: QDialog | None = None
+        self._help_text: QTextEdit | None = None
+        self._help_lang: str | None = None
+
         self._setup_ui()
         self._setup_scroll_sync()
         
@@ -164,6 +238,10 @@ class GridSelectorWindow(QMainWindow):
 
         self._preview_cache: OrderedDict[str, Image.Image] = OrderedDict()
         self._cache_capacity: int = 20
+
+        # Full-res viewer pixmaps live in QPixmapCache (see _viewer_cache_key);
+        # this tracks background decodes by path so they can be cancelled or awaited
+        self._viewer_prefetching: dict[str, concurrent.futures.Future] = {}
         self._animations: list[QPropertyAnimation] = []
 
         try:
@@ -175,9 +253,16 @@ class GridSelectorWindow(QMainWindow):
             max_workers = 4
         self.thumb_executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         self.preview_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2) # Separate high-priority executor
+        # Viewer neighbour decodes get their own pool so they never queue ahead of slot previews
+        self.viewer_prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Single worker: ratings.csv is rewritten on every save, so writes must stay ordered
+        self.rating_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._metadata_cache: dict[str, tuple[str, str]] = {} # path -> (date, camera), rating worker only
         self.thumb_load_version: int = 0
         self.thumbnail_loaded.connect(self._apply_thumbnail)
         self.preview_ready.connect(self._on_preview_ready)
+        self.viewer_prefetched.connect(self._on_viewer_prefetched)
+        self.rating_failed.connect(self._on_rating_failed)
 
         self.list_widget.thumbSizeChanged.connect(self.on_thumb_size_changed)
 
@@ -190,6 +275,12 @@ class GridSelectorWindow(QMainWindow):
         self._thumb_reload_timer.timeout.connect(self._do_thumb_reload)
         
         self._thumb_reload_timer.timeout.connect(self._do_thumb_reload)
+
+        # Folder reload after undo (debounced: back-to-back undos collapse into one rescan)
+        self._reload_timer: QTimer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self._reload_current_folder)
         
         # Loading State
         # self.loading_progress = Signal(int, int) # Unused
@@ -215,9 +306,12 @@ class GridSelectorWindow(QMainWindow):
         
         self.thumb_executor.shutdown(wait=False)
         self.preview_executor.shutdown(wait=False)
+        self.viewer_prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self.rating_executor.shutdown(wait=True) # Flush pending rating writes
         if self.file_worker_thread.isRunning():
             self.file_worker_thread.quit()
             self.file_worker_thread.wait()
+        self.organizer_widget.shutdown()
         super().closeEvent(event)
 
     def showEvent(self, event):
@@ -232,8 +326,6 @@ class GridSelectorWindow(QMainWindow):
             right_width = total_width - left_width
             self.splitter_main.setSizes([left_width, right_width])
         
-        self.setStyleSheet(DARK_STYLE)
-        
         if hasattr(self, 'list_widget'):
             thumb_size = self.list_widget._thumb_size if hasattr(self.list_widget, '_thumb_size') else 160
             grid_w = thumb_size + self.list_widget._grid_padding_w
@@ -503,7 +595,7 @@ class GridSelectorWindow(QMainWindow):
         self.slot1_stack.addWidget(self.slot1_preview_widget)
 
         # Slot 1 - Page 1: Organizer Tree
-        self.org_tree_widget = QTreeWidget()
+        self.org_tree_widget = QTreeView()
         self.org_tree_widget.setStyleSheet("background: transparent; border: none;")
         self.slot1_stack.addWidget(self.org_tree_widget)
 
@@ -687,7 +779,7 @@ class GridSelectorWindow(QMainWindow):
             self.slot2_stack.setCurrentIndex(1)
             
             if self.current_folder:
-                self.organizer_widget.lbl_src.setText(str(self.current_folder))
+                self.organizer_widget.set_source(self.current_folder)
         else:
             self.left_stack.setCurrentIndex(0)
             self.slot1_stack.setCurrentIndex(0)
@@ -709,12 +801,12 @@ class GridSelectorWindow(QMainWindow):
             QMessageBox.information(self, "Info", "되돌릴 이동이 없습니다.")
             return
         moves = self.undo_stack.pop()
-        self.redo_stack.append(list(moves))
+        self.redo_stack.append(moves)
         
-        # Reverse moves: (dest, src) -> src is original location
-        # We need to move from dest -> src
+        # Reverse moves: ops are (src, dest) -> src is original location
+        # We need to move from dest -> src, last move first
         reverse_ops = []
-        for dest_path, src_path in moves:
+        for src_path, dest_path in reversed(moves):
             if not dest_path.exists(): continue
             target_path = src_path
             
@@ -741,9 +833,9 @@ class GridSelectorWindow(QMainWindow):
         # Redo is basically repeating the original moves
         # but we need to check if source still exists (or was restored)
         redo_ops = []
-        recorded_moves = [] # For undo stack
+        redone = [] # For undo stack, same (src, dest) contract
         
-        for dest_path, src_path in moves:
+        for src_path, dest_path in moves:
              # src_path is the ORIGINAL source. 
              # But if we undid, the file should be back at src_path (or restored name)
              # This is tricky because Undo might have renamed it.
@@ -764,12 +856,12 @@ class GridSelectorWindow(QMainWindow):
              if not candidate.exists(): continue
              
              redo_ops.append((candidate, dest_path))
-             recorded_moves.append((dest_path, src_path)) # Keep original contract
+             redone.append((src_path, dest_path))
         
         if redo_ops:
             # We push back to undo stack immediately? Or wait for finish?
             # Standard pattern: push to undo stack
-            self.undo_stack.append(recorded_moves)
+            self.undo_stack.append(redone)
             self._start_file_operation(redo_ops, 'move', is_undo=False)
 
     def toggle_language(self):
@@ -919,6 +1011,9 @@ class GridSelectorWindow(QMainWindow):
     # Updated to accept ask_pairing flag
     def load_folder_grid(self, folder: Path, ask_pairing: bool = False):
         self.list_widget.clear()
+        self.list_widget.filter_active = False
+        self._row_paths = np.empty(0, dtype=object)
+        QPixmapCache.clear()
         self.thumb_load_version += 1
         current_version = self.thumb_load_version
         
@@ -1092,6 +1187,9 @@ class GridSelectorWindow(QMainWindow):
             
             visible_paths.append(str(f))
 
+        # Row index -> path, used for vectorized lookups (see move_selected_to_target)
+        self._row_paths = np.array(visible_paths, dtype=object)
+
         self.list_widget.scrollToTop()
         self.preview_pixmaps = [None, None]
         # Clear Previews
@@ -1118,7 +1216,7 @@ class GridSelectorWindow(QMainWindow):
             # log_debug(f"DEBUG: Loading {path.name} at size {size}")
             img = load_pil_image(Path(path), max_size=size)
             if img:
-                qimg = pil_to_qimage(img)
+                qimg = pil_to_qimage(img, copy=False)
                 if version == self.thumb_load_version:
                     self.thumbnail_loaded.emit(str(path), qimg)
         except Exception as e:
@@ -1234,8 +1332,8 @@ class GridSelectorWindow(QMainWindow):
             # 1. Check Cache
             img = self._preview_cache.get(str(path))
             if img is not None:
-                # Fast Path (already loaded)
-                qimg = pil_to_qimage(img)
+                # Fast Path (already loaded); fromImage copies, so no defensive copy needed
+                qimg = pil_to_qimage(img, copy=False)
                 pixmap = QPixmap.fromImage(qimg)
                 self.preview_pixmaps[slot_idx] = pixmap
                 widget = self.preview_widget_1 if slot_idx == 0 else self.preview_widget_2
@@ -1258,9 +1356,8 @@ class GridSelectorWindow(QMainWindow):
         try:
             img = load_pil_image(path) # Full load
             if img:
-                qimg = pil_to_qimage(img)
-                # Keep QImage alive or copy deeper if needed?
-                # qimg is local -> conversion to QPixmap on main thread handles data copy
+                # Buffer travels with the QImage object; fromImage on the GUI thread copies it
+                qimg = pil_to_qimage(img, copy=False)
                 self.preview_ready.emit(str(path), slot_idx, qimg)
             else:
                 print(f"Failed to load image: {path}")
@@ -1335,7 +1432,6 @@ class GridSelectorWindow(QMainWindow):
             self.dual_window = QMainWindow()
             self.dual_window.setWindowTitle("Dual View")
             self.dual_window.resize(600, 800)
-            self.dual_window.setStyleSheet(self.styleSheet())
             
             dual_widget = QWidget()
             self.dual_window.setCentralWidget(dual_widget)
@@ -1404,23 +1500,36 @@ class GridSelectorWindow(QMainWindow):
         if source == self.list_widget and event.type() == QEvent.KeyPress:
             if self.rating_mode_enabled and self.rating_manager:
                 key = event.key()
-                if key == Qt.Key_1:
-                    self.rate_current_image(1)
+                if key in RATING_KEYS:
+                    # Held keys auto-repeat: swallow repeats instead of toggling the rating N times
+                    if not event.isAutoRepeat():
+                        self._queue_rate(RATING_KEYS[key])
                     return True  # Consume event
-                elif key == Qt.Key_2:
-                    self.rate_current_image(2)
-                    return True
-                elif key == Qt.Key_3:
-                    self.rate_current_image(3)
-                    return True
-                elif key == Qt.Key_4:
-                    self.rate_current_image(4)
-                    return True
-                elif key == Qt.Key_5:
-                    self.rate_current_image(5)
-                    return True
         return super().eventFilter(source, event)
 
+    def _queue_rate(self, rating: int):
+        self._pending_rate = rating
+        self._arm_key_flush()
+
+    def _queue_move(self, target_idx: int):
+        self._pending_move_target = target_idx
+        self._arm_key_flush()
+
+    def _arm_key_flush(self):
+        # Presses arriving before the event loop comes back around collapse into one operation
+        if self._key_flush_armed: return
+        self._key_flush_armed = True
+        QTimer.singleShot(0, self._flush_pending_keys)
+
+    def _flush_pending_keys(self):
+        self._key_flush_armed = False
+        rating, self._pending_rate = self._pending_rate, None
+        target_idx, self._pending_move_target = self._pending_move_target, None
+        if rating is not None:
+            self.rate_current_image(rating)
+        if target_idx is not None:
+            self.move_selected_to_target(target_idx)
+
     def move_selected_to_target(self, target_idx):
         if target_idx == 1:
             dest_root = self.target_folder1
@@ -1449,52 +1558,50 @@ class GridSelectorWindow(QMainWindow):
         # Add explicitly tracked siblings (from fuzzy grouping)
         all_files_to_move.update(hidden_siblings)
 
-        # Legacy Fallback (only if NOT using Pair Mode or if logic requires it)
-        # If pair logic is OFF, we still might want to move XMP sidecars.
-        if not self.pair_mode_enabled:
-            pass # Keep logic below?
-        else:
-            # If Pair Mode is ON, we rely on the grouping logic above mostly.
-            # BUT, we still need to catch .xmp sidecars which are not in the group logic yet?
-            # Our fuzzy logic groups RAW+JPG. But excludes XMP.
-            # So we SHOULD run sidecar detection for XMPs.
-            pass
-            
-        # Run XMP/Sidecar detection for ALL primary files (safety)
-        files_to_scan = list(all_files_to_move)
-        for p in files_to_scan:
-             parent = p.parent
-             stem = p.stem
-             try:
-                 # Be careful not to pick up unrelated files if fuzzy logic is used.
-                 # But XMP usually matches stem exactly.
-                 for cand in parent.glob(f"{stem}*"):
-                     if cand.suffix.lower() in ['.xmp', '.xml'] and cand not in all_files_to_move:
-                         all_files_to_move.add(cand)
-             except Exception:
-                 pass
-        else:
-            # Original logic: Ask user
-            siblings_found = []
-            for p in primary_files:
-                parent = p.parent
-                stem = p.stem
-                try:
-                    for cand in parent.glob(f"{stem}.*"):
-                        if cand != p and cand not in all_files_to_move:
-                             siblings_found.append(cand)
-                except Exception:
-                    pass
+        # Single directory pass per parent folder, classifying candidates into:
+        # - sidecars (XMP/XML, for ALL files, always moved along). Our fuzzy logic groups
+        #   RAW+JPG but excludes XMP, so this runs in Pair Mode too.
+        # - other siblings of a primary file (only without Pair Mode, which already
+        #   attached them): ask user
+        ask_siblings = not self.pair_mode_enabled
+        primary_set = set(primary_files)
+        by_parent: dict[Path, list[Path]] = {}
+        for p in all_files_to_move:
+            by_parent.setdefault(p.parent, []).append(p)
+
+        sidecars = set()
+        siblings_found = set()
+        for parent, members in by_parent.items():
+            try:
+                with os.scandir(parent) as it:
+                    # Case-folded for matching, like glob on Windows/macOS
+                    entries = [(e.name, e.name.casefold()) for e in it if e.is_file()]
+            except OSError:
+                continue
+            for p in members:
+                # Be careful not to pick up unrelated files if fuzzy logic is used:
+                # require "stem." so IMG_1 doesn't claim IMG_10.xmp (IMG_1.jpg.xmp still matches).
+                prefix = (p.stem + ".").casefold()
+                own_name = p.name.casefold()
+                for name, folded in entries:
+                    if not folded.startswith(prefix): continue
+                    if os.path.splitext(folded)[1] in SIDECAR_EXT:
+                        sidecars.add(parent / name)
+                    elif ask_siblings and p in primary_set and folded != own_name:
+                        siblings_found.add(parent / name)
+        all_files_to_move |= sidecars
+
+        if ask_siblings:
+            siblings_found -= all_files_to_move
             
             if siblings_found:
                  msg = f"Found {len(siblings_found)} associated files (e.g. RAW/JPG pairs).\nMove them together?"
                  ret = QMessageBox.question(self, "Associated Files", msg, QMessageBox.Yes | QMessageBox.No)
                  if ret == QMessageBox.Yes:
-                     all_files_to_move.update(siblings_found)
+                     all_files_to_move |= siblings_found
 
         # Prepare operations
-        ops = []
-        recorded_moves = [] # For Undo Stack (dest, src)
+        ops = [] # (src, dest); also pushed as-is onto the Undo Stack
         
         for src in all_files_to_move:
             dest = dest_root / src.name
@@ -1510,7 +1617,6 @@ class GridSelectorWindow(QMainWindow):
                      i += 1
             
             ops.append((src, dest))
-            recorded_moves.append((dest, src))
 
         if ops:
             # OPTIMISTIC UI UPDATE: Remove items immediately
@@ -1519,23 +1625,20 @@ class GridSelectorWindow(QMainWindow):
             # Warning: siblings are hidden, so we only remove visible items that match
             
             # 1. Identify all paths being moved
-            paths_being_moved = {str(src) for src, _ in ops}
+            paths_being_moved = np.fromiter((str(src) for src, _ in ops), dtype=object, count=len(ops))
             
-            # 2. Iterate list and remove items
-            # We walk backwards to avoid index issues
-            rows_to_remove = []
-            for i in range(self.list_widget.count()):
-                item = self.list_widget.item(i)
-                item_path = item.data(Qt.UserRole)
-                if item_path in paths_being_moved:
-                    rows_to_remove.append(i)
+            # 2. Vectorized compare against the row -> path array (kept in sync with the list)
+            if len(self._row_paths) != self.list_widget.count():
+                self._rebuild_row_paths()
+            rows_to_remove = np.flatnonzero(np.isin(self._row_paths, paths_being_moved))
             
-            # Remove in reverse order
-            for r in sorted(rows_to_remove, reverse=True):
-                self.list_widget.takeItem(r)
+            # Remove in reverse order to avoid index issues
+            for r in rows_to_remove[::-1]:
+                self.list_widget.takeItem(int(r))
+            self._row_paths = np.delete(self._row_paths, rows_to_remove)
 
             # Update Undo Stack
-            self.undo_stack.append(recorded_moves)
+            self.undo_stack.append(ops)
             
             # Start Background Operation
             self._start_file_operation(ops, 'move')
@@ -1546,28 +1649,17 @@ class GridSelectorWindow(QMainWindow):
         
         # Rating Mode takes priority over move keys
         if self.rating_mode_enabled and self.rating_manager:
-            if key == Qt.Key_1:
-                self.rate_current_image(1)
-                return
-            elif key == Qt.Key_2:
-                self.rate_current_image(2)
-                return
-            elif key == Qt.Key_3:
-                self.rate_current_image(3)
-                return
-            elif key == Qt.Key_4:
-                self.rate_current_image(4)
-                return
-            elif key == Qt.Key_5:
-                self.rate_current_image(5)
+            if key in RATING_KEYS:
+                if not event.isAutoRepeat():
+                    self._queue_rate(RATING_KEYS[key])
                 return
-        
+
         # Move keys (only when NOT in rating mode)
         if not self.rating_mode_enabled:
-            if key == Qt.Key_1:
-                self.move_selected_to_target(1)
-            elif key == Qt.Key_2:
-                self.move_selected_to_target(2)
+            if key in (Qt.Key_1, Qt.Key_2):
+                # Auto-repeat of a held key would spawn one file worker per repeat
+                if not event.isAutoRepeat():
+                    self._queue_move(1 if key == Qt.Key_1 else 2)
             elif key == Qt.Key_Z and (mods & Qt.ControlModifier):
                 self.undo_last_move()
             elif key == Qt.Key_Y and (mods & Qt.ControlModifier):
@@ -1608,83 +1700,51 @@ class GridSelectorWindow(QMainWindow):
         worker.error.connect(lambda e: print(f"File Op Error: {e}"))
         
         if is_undo:
-             worker.finished.connect(lambda: self.load_folder_grid(self.current_folder))
+             # Queued: finished is emitted on the worker thread, the reload touches widgets
+             worker.finished.connect(self._reload_timer.start, Qt.QueuedConnection)
 
         thread.start()
 
+    def _rebuild_row_paths(self):
+        count = self.list_widget.count()
+        self._row_paths = np.fromiter(
+            (self.list_widget.item(i).data(Qt.UserRole) for i in range(count)),
+            dtype=object, count=count
+        )
+
+    def _reload_current_folder(self):
+        if self.current_folder is not None:
+            self.load_folder_grid(self.current_folder)
+
     def move_item_to_target(self, item, target_idx):
         item.setSelected(True)
         self.move_selected_to_target(target_idx)
 
     def show_help(self):
-        # Updated Help Text
-        if self.language == 'en':
-            text = (
-                "※ Program Usage Guide\n\n"
-                "■ Mode: Image Grid (Default)\n"
-                "- Left Panel: Shows thumbnails of images in the selected folder.\n"
-                "- Right Panel: Shows two preview slots (Slot 1 & Slot 2).\n"
-                "- Click a thumbnail to view in Slot 1.\n"
-                "- Ctrl + Click a thumbnail to view in Slot 2.\n"
-                "- Use 'Dual Mode' to detach the right panel into a separate window.\n"
-                "- Use 'Independent Zoom' to toggle linked zooming between slots.\n"
-                "- Drag and Drop images to Target1/Target2 labels at bottom right.\n\n"
-                "■ Mode: Organize Photos\n"
-                "- Click 'Organize Photos' to switch to this mode.\n"
-                "- Left Panel: Settings for sorting (Source, Destination, Grouping, Action).\n"
-                "- Slot 1 (Top Right): Shows the preview tree of how files will be organized.\n"
-                "- Slot 2 (Bottom Right): Shows execution logs and progress.\n"
-                "- Click 'Scan' to analyze files, then 'Start' to execute the move/copy.\n"
-                "- Navigating to 'Image Folder' or 'Targets' will automatically exit this mode.\n\n"
-                "■ Shortcuts\n"
-                "- 1 / 2 + Click: Move to Target 1 / 2\n"
-                "- Ctrl+Z: Undo Move\n"
-                "- Ctrl+Y: Redo Move\n"
-                "- Ctrl+D: Toggle Dual Mode\n"
-                "- Ctrl+Scroll: Resize Thumbnails\n"
-            )
-        else:
-            text = (
-                "※ 프로그램 사용 안내\n\n"
-                "■ 모드: 이미지 그리드 (기본)\n"
-                "- 왼쪽 패널: 선택된 폴더의 이미지 썸네일을 표시합니다.\n"
-                "- 오른쪽 패널: 두 개의 프리뷰 슬롯(Slot 1, Slot 2)을 보여줍니다.\n"
-                "- 썸네일 클릭: Slot 1 상단 프리뷰에 표시\n"
-                "- Ctrl + 클릭: Slot 2 하단 프리뷰에 표시\n"
-                "- '듀얼 모드' 버튼으로 오른쪽 패널을 별도 창으로 분리할 수 있습니다.\n"
-                "- '독립 줌 모드'로 두 슬롯의 줌 연결을 켜고 끌 수 있습니다.\n"
-                "- 우측 하단의 Target1/Target2 라벨로 이미지를 드래그하여 이동할 수 있습니다.\n\n"
-                "■ 모드: 사진 정리 (Organize Photos)\n"
-                "- '사진 정리' 버튼을 누르면 정리 모드로 전환됩니다.\n"
-                "- 왼쪽 패널: 분류 설정 (원본/대상 폴더, 그룹 방식, 이동/복사 등).\n"
-                "- Slot 1 (우측 상단): 스캔 후 파일이 어떻게 정리될지 트리 구조로 미리 보여줍니다.\n"
-                "- Slot 2 (우측 하단): 실행 로그와 진행률을 표시합니다.\n"
-                "- 'Scan'을 눌러 분석 후, 'Start'를 눌러 실행하세요.\n"
-                "- 'Image Folder'나 타겟 폴더 버튼을 누르면 자동으로 정리 모드가 종료됩니다.\n\n"
-                "■ 단축키\n"
-                "- 1 / 2 + 클릭: Target 1 / 2 로 이동\n"
-                "- Ctrl+Z: 이동 취소 (Undo)\n"
-                "- Ctrl+Y: 다시 실행 (Redo)\n"
-                "- Ctrl+D: 듀얼 모드 토글\n"
-                "- Ctrl+휠: 썸네일 크기 조절\n"
-            )
-        
-        dlg = QDialog(self)
-        dlg.setWindowTitle("Help")
-        dlg.resize(600, 600)
-        
-        layout = QVBoxLayout(dlg)
-        text_edit = QTextEdit()
-        text_edit.setReadOnly(True)
-        text_edit.setText(text)
-        text_edit.setStyleSheet("background-color: #1E1E1E; color: #E0E0E0; font-size: 11pt;")
-        layout.addWidget(text_edit)
-        
-        btn_box = QDialogButtonBox(QDialogButtonBox.Ok)
-        btn_box.accepted.connect(dlg.accept)
-        layout.addWidget(btn_box)
-        
-        dlg.exec()
+        text = _HELP_EN if self.language == 'en' else _HELP_KO
+
+        # Build the dialog once and reuse it; only the text changes with the language
+        if self._help_dialog is None:
+            dlg = QDialog(self)
+            dlg.setWindowTitle("Help")
+            dlg.resize(600, 600)
+
+            layout = QVBoxLayout(dlg)
+            self._help_text = QTextEdit()
+            self._help_text.setReadOnly(True)
+            self._help_text.setStyleSheet("background-color: #1E1E1E; color: #E0E0E0; font-size: 11pt;")
+            layout.addWidget(self._help_text)
+
+            btn_box = QDialogButtonBox(QDialogButtonBox.Ok)
+            btn_box.accepted.connect(dlg.accept)
+            layout.addWidget(btn_box)
+            self._help_dialog = dlg
+
+        if self._help_lang != self.language:
+            self._help_text.setText(text)
+            self._help_lang = self.language
+
+        self._help_dialog.exec()
 
     def toggle_viewer_mode(self, checked):
         self.viewer_mode_enabled = checked
@@ -1711,14 +1771,24 @@ class GridSelectorWindow(QMainWindow):
         if not items: return
         
         item = items[0] # Single view focus
-        path = Path(item.data(Qt.UserRole))
+        path_str = item.data(Qt.UserRole)
         
-        if not path.exists(): return
+        key = self._viewer_cache_key(path_str)
+        if key is None: return
+        path = Path(path_str)
         
         # Check cache or load
-        # Use existing cache logic if possible or load fresh high-res
         # For viewer, we want high quality.
-        pixmap = self._load_full_res_pixmap(path)
+        pixmap = self._viewer_cache_find(key)
+        if pixmap is None:
+            pending = self._viewer_prefetching.pop(path_str, None)
+            if pending is not None and not pending.cancel():
+                # Already decoding in the background: wait for it rather than decode twice
+                qimg = pending.result()
+                pixmap = QPixmap.fromImage(qimg) if not qimg.isNull() else QPixmap()
+            else:
+                pixmap = self._load_full_res_pixmap(path)
+            self._cache_viewer_pixmap(key, pixmap)
         
         # Get Rating
         rating = 0
@@ -1734,13 +1804,79 @@ class GridSelectorWindow(QMainWindow):
         
         self.viewer_widget.load_image(path, pixmap, rating)
 
+        # Warm the cache for the neighbours so arrowing back and forth doesn't re-decode
+        self._prefetch_viewer_neighbors(self.list_widget.row(item))
+
     def _load_full_res_pixmap(self, path):
          # Helper to load full res
          img = load_pil_image(path, max_size=None) # Full size
          if img:
-             return QPixmap.fromImage(pil_to_qimage(img))
+             return QPixmap.fromImage(pil_to_qimage(img, copy=False))
          return QPixmap()
 
+    @staticmethod
+    def _viewer_cache_key(path_str: str) -> str | None:
+        # mtime in the key: an edited file simply misses instead of showing stale pixels
+        try:
+            return f"{path_str}:{os.stat(path_str).st_mtime_ns}"
+        except OSError:
+            return None
+
+    @staticmethod
+    def _viewer_cache_find(key: str) -> QPixmap | None:
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _cache_viewer_pixmap(self, key: str, pixmap: QPixmap):
+        if pixmap.isNull(): return
+        QPixmapCache.insert(key, pixmap)
+
+    def _prefetch_viewer_neighbors(self, row: int):
+        # Nearest first: +1, -1, +2, -2 ...
+        rows = [row + sign * d for d in range(1, VIEWER_PREFETCH_RADIUS + 1) for sign in (1, -1)]
+        wanted = []
+        for r in rows:
+            item = self.list_widget.item(r)
+            if item is not None:
+                wanted.append(item.data(Qt.UserRole))
+
+        # Drop queued decodes that fell out of the window (key-repeat would pile them up);
+        # ones already running finish and land in the cache
+        inflight = self._viewer_prefetching
+        for path_str in [p for p in inflight if p not in wanted]:
+            if inflight[path_str].cancel():
+                del inflight[path_str]
+
+        for path_str in wanted:
+            if path_str in inflight:
+                continue
+            key = self._viewer_cache_key(path_str)
+            if key is None or self._viewer_cache_find(key) is not None:
+                continue
+            inflight[path_str] = self.viewer_prefetch_executor.submit(self._viewer_prefetch_task, path_str)
+
+    def _viewer_prefetch_task(self, path_str: str):
+        # Worker thread: decode only. QPixmap must be created on the GUI thread.
+        qimg = QImage()
+        try:
+            img = load_pil_image(Path(path_str), max_size=None)
+            if img:
+                qimg = pil_to_qimage(img, copy=False)
+        except Exception as e:
+            print(f"Viewer prefetch error: {e}")
+        self.viewer_prefetched.emit(path_str, qimg)
+        return qimg # for _load_viewer_image when it waits on this decode
+
+    def _on_viewer_prefetched(self, path_str, qimg):
+        self._viewer_prefetching.pop(path_str, None)
+        if not qimg.isNull():
+            key = self._viewer_cache_key(path_str)
+            # Skip if the viewer already waited on this decode and cached it
+            if key is not None and self._viewer_cache_find(key) is None:
+                self._cache_viewer_pixmap(key, QPixmap.fromImage(qimg))
+
     def viewer_next(self):
         row = self.list_widget.currentRow()
         if row < self.list_widget.count() - 1:
@@ -1778,38 +1914,71 @@ class GridSelectorWindow(QMainWindow):
             return
             
         count = 0
+        new_rating = rating
+        # One listdir per parent folder instead of a stat per selected file
+        listings = {}
         for item in items:
-            try:
-                path = Path(str(item.data(Qt.UserRole)))  # Avoid recursion from Path(Path(...))
-            except Exception:
+            path_str = item.data(Qt.UserRole)
+            if not path_str:
                 continue
-            if not path.exists():
+            parent, name = os.path.split(path_str)
+            names = listings.get(parent)
+            if names is None:
+                try:
+                    names = set(os.listdir(parent))
+                except OSError:
+                    names = set()
+                listings[parent] = names
+            if name not in names:
                 continue
 
             # Toggle logic: same rating again → remove rating
-            existing = self.rating_manager.get_rating(path.name)
-            if existing == rating:
-                self.rating_manager.remove_rating(path.name)
-                widget = self.list_widget.itemWidget(item)
-                if widget:
-                    widget.set_rating(0)
-                count += 1
-                print(f"Removed rating for {path.name}")
-            else:
-                date_str, camera_str = get_image_metadata(path)
-                self.rating_manager.save_rating(path.name, rating, date_str, camera_str)
-                widget = self.list_widget.itemWidget(item)
-                if widget:
-                    widget.set_rating(rating)
-                count += 1
-                print(f"Rated {path.name}: {rating}")
+            widget = self.list_widget.itemWidget(item)
+            existing = widget.rating if widget else self.rating_manager.get_rating(name)
+            new_rating = 0 if existing == rating else rating
+
+            # Optimistic UI: show the stars now, persist (EXIF read + CSV write) in the background
+            if widget:
+                widget.set_rating(new_rating)
+            self.rating_executor.submit(
+                self._persist_rating_task, self.rating_manager, path_str, new_rating, existing
+            )
+            count += 1
             
         if self.viewer_mode_enabled and self.viewer_widget.isVisible():
-            self.viewer_widget.set_rating(rating)
+            # Update stars only; viewer.set_rating would re-emit rating_changed back into here
+            self.viewer_widget.show_rating(new_rating)
     
         if count > 0:
             self.statusBar().showMessage(f"Updated rating for {count} images.", 2000)
 
+    def _persist_rating_task(self, manager, path_str: str, rating: int, previous: int):
+        # Runs on rating_executor
+        name = os.path.basename(path_str)
+        try:
+            if rating == 0:
+                manager.remove_rating(name)
+                print(f"Removed rating for {name}")
+            else:
+                meta = self._metadata_cache.get(path_str)
+                if meta is None:
+                    meta = get_image_metadata(Path(path_str))
+                    self._metadata_cache[path_str] = meta
+                date_str, camera_str = meta
+                manager.save_rating(name, rating, date_str, camera_str)
+                print(f"Rated {name}: {rating}")
+        except Exception as e:
+            print(f"Rating save failed for {name}: {e}")
+            self.rating_failed.emit(path_str, previous)
+
+    def _on_rating_failed(self, path_str, previous):
+        # Revert the optimistic star update
+        for r in np.flatnonzero(self._row_paths == path_str):
+            widget = self.list_widget.itemWidget(self.list_widget.item(int(r)))
+            if widget:
+                widget.set_rating(previous)
+        self.statusBar().showMessage(f"Failed to save rating for {os.path.basename(path_str)}.", 3000)
+
     def clear_all_ratings(self):
         if not self.rating_manager:
             return
@@ -1820,7 +1989,8 @@ class GridSelectorWindow(QMainWindow):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.rating_manager.clear_all_ratings()
+            # Queue behind any pending rating writes so none of them lands after the clear
+            self.rating_executor.submit(self.rating_manager.clear_all_ratings)
             # Update all thumbnails to show no stars
             for i in range(self.list_widget.count()):
                 item = self.list_widget.item(i)
@@ -1849,6 +2019,7 @@ class GridSelectorWindow(QMainWindow):
         for i in range(count):
             item = self.list_widget.item(i)
             item.setHidden(False)
+        self.list_widget.filter_active = False
         self.statusBar().showMessage(f"Filter reset. Showing all {count} images.", 3000)
 
     def apply_file_filter(self, allowed_names: set):
@@ -1861,12 +2032,12 @@ class GridSelectorWindow(QMainWindow):
         
         for i in range(count):
             item = self.list_widget.item(i)
-            path = Path(item.data(Qt.UserRole))
-            if path.name in allowed_names:
+            if os.path.basename(item.data(Qt.UserRole)) in allowed_names:
                 item.setHidden(False)
                 visible_count += 1
             else:
                 item.setHidden(True)
                 hidden_count += 1
+        self.list_widget.filter_active = hidden_count > 0
         
         self.statusBar().showMessage(f"Filter applied. {visible_count} visible.", 3000)
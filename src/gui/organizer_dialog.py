@@ -1,104 +1,345 @@
+import os
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from array import array
 from pathlib import Path
-from PySide6.QtCore import Qt, QThread, Signal, QObject, QSettings
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QObject, QSettings, QTimer, QAbstractItemModel, QModelIndex
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QFileDialog, QComboBox, QCheckBox, QGroupBox, QProgressBar,
-    QTreeWidget, QTreeWidgetItem, QMessageBox, QTabWidget,
+    QTreeView, QMessageBox, QTabWidget,
     QTextEdit, QRadioButton, QButtonGroup, QListWidget, QListWidgetItem
 )
-from ..core.sorter import Sorter
+from ..core.sorter import Sorter, SortCancelled
+from ..core.metadata import MetaTable
 from ..i18n.translations import TRANSLATIONS
 from .styles import DARK_STYLE
 
+# Structure tokens in default order, mapped to their translation keys
+_KEY_LABELS = {
+    "date": "struct_date",
+    "camera": "struct_camera",
+    "kind": "struct_kind",
+    "year": "struct_year",
+    "month": "struct_month",
+    "lens": "struct_lens",
+}
+_ALL_KEYS = tuple(_KEY_LABELS)
+
+# How long closing the window waits for a cancelled scan/sort to wind down
+SHUTDOWN_WAIT_MS = 3000
+
+# Plan folders added to the tree per event-loop turn
+POPULATE_CHUNK = 500
+
+# Sample folder names shown in the structure preview
+_PREVIEW_VALUES = {
+    "date": "2023-12-25",
+    "year": "2023",
+    "month": "2023-12",
+    "camera": "OM-1",
+    "lens": "M.Zuiko_12-40mm_Pro",
+    "kind": "RAW",
+    "ext": "ORF",
+}
+
 class Worker(QObject):
     progress = Signal(str, int, int) # status, current, total
     finished = Signal()
     error = Signal(str)
     
     # For Scan
-    scan_result = Signal(object, object) # files, metas
+    scan_result = Signal(object, object, object) # files, metas, plan
+    scan_chunk = Signal(object, object, object) # partial files, metas, {folder: count}
+
+    # For re-planning scanned files after the structure/destination changed
+    plan_result = Signal(object, object) # plan cache key, plan
 
     # For Sort
     sort_result = Signal(object) # results dict
 
-    def __init__(self, sorter, mode='scan'):
+    def __init__(self, sorter=None, mode='scan'):
         super().__init__()
         self.sorter = sorter
         self.mode = mode
         self.src_root = None
         self.plan = None
-        self._mutex = QObject() # dummy
+        # Progress throttling: emit every N files or every 50 ms, whichever first
+        self._last_emit_ts = 0.0
+        self._last_emit = 0
+        self._emit_every = 1
+        self._emit_total = -1
 
     def run_scan(self):
         try:
-            files, metas = self.sorter.scan(self.src_root, self._emit_progress)
-            self.scan_result.emit(files, metas)
+            files, metas = self.sorter.scan(self.src_root, self._emit_progress, self._emit_chunk)
+            # Plan here as well so the GUI thread only has to draw the result
+            plan = self.sorter.plan_sort(files, metas)
+            self.scan_result.emit(files, metas, plan)
+        except SortCancelled:
+            pass # shutting down; nobody is waiting for the result
+        except Exception as e:
+            self.error.emit(str(e))
+        finally:
+            self.finished.emit()
+
+    def run_scan_with(self, sorter, src_root):
+        self.sorter = sorter
+        self.src_root = src_root
+        self._emit_total = -1 # new job: reset progress throttling
+        self.run_scan()
+
+    def run_plan_with(self, sorter, files, metas, key):
+        try:
+            self.plan_result.emit(key, sorter.plan_sort(files, metas))
         except Exception as e:
             self.error.emit(str(e))
         finally:
             self.finished.emit()
 
+    def run_sort_with(self, sorter, plan):
+        self.sorter = sorter
+        self.plan = plan
+        self._emit_total = -1
+        self.run_sort()
+
     def run_sort(self):
         try:
+            self.sorter.prepare_dirs(self.plan)
             # We use a simple callback wrapper
-            res = self.sorter.execute_sort(self.plan, self._emit_progress_sort)
+            res = self.sorter.execute_sort(self.plan, self._emit_progress_sort, dirs_ready=True)
             self.sort_result.emit(res)
+        except SortCancelled:
+            pass
         except Exception as e:
             self.error.emit(str(e))
         finally:
             self.finished.emit()
 
+    def _should_emit(self, current, total):
+        if total != self._emit_total:
+            self._emit_total = total
+            self._emit_every = max(1, total // 200)
+            self._last_emit = 0
+        now = time.monotonic()
+        # Distance since the last emit, not current % N: pool batches advance current in jumps
+        if (current != total and current - self._last_emit < self._emit_every
+                and (now - self._last_emit_ts) < 0.05):
+            return False
+        self._last_emit = current
+        self._last_emit_ts = now
+        return True
+
+    def _emit_chunk(self, files, metas):
+        # Group the batch here so the GUI thread only merges folder counts
+        counts = {str(folder): len(srcs) for folder, srcs in self.sorter.group(metas).items()}
+        self.scan_chunk.emit(files, metas, counts)
+
     def _emit_progress(self, current, total):
-        self.progress.emit("Scanning...", current, total)
+        if self._should_emit(current, total):
+            self.progress.emit("Scanning...", current, total)
 
     def _emit_progress_sort(self, status, current, total):
-        self.progress.emit(status, current, total)
+        if self._should_emit(current, total):
+            self.progress.emit(status, current, total)
+
+
+class _TranslationTable(dict):
+    """Translation dict whose lookups fall back to the key itself."""
+    def __missing__(self, key):
+        return key
+
+
+class PlanModel(QAbstractItemModel):
+    """Flat (folder, file count) model for the plan preview, stored as two parallel arrays."""
+    HEADERS = ("Folder", "Files")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._folders: list[str] = []
+        self._counts = array('i')
+        self._rows: dict[str, int] = {} # folder -> row, for incremental updates
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._folders)) or not (0 <= column < 2):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._folders)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        if index.column() == 0:
+            return self._folders[row]
+        return f"{self._counts[row]} files"
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def set_plan(self, plan):
+        """Replace the contents with a finished plan in a single reset."""
+        self.beginResetModel()
+        self._folders = [str(folder) for folder in plan]
+        self._counts = array('i', (len(files) for files in plan.values()))
+        self._rows = {folder: row for row, folder in enumerate(self._folders)}
+        self.endResetModel()
+
+    def clear(self):
+        self.set_plan({})
+
+    def matches(self, plan):
+        """True when the rows already hold exactly plan's folders and counts."""
+        if len(plan) != len(self._folders):
+            return False
+        for folder, files in plan.items():
+            row = self._rows.get(str(folder))
+            if row is None or self._counts[row] != len(files):
+                return False
+        return True
+
+    def add_counts(self, counts):
+        """Merge a {folder: n} batch from a partial scan."""
+        new_folders = []
+        changed = []
+        for folder, n in counts.items():
+            row = self._rows.get(folder)
+            if row is None:
+                new_folders.append((folder, n))
+            else:
+                self._counts[row] += n
+                changed.append(row)
+        
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), 1), self.index(max(changed), 1))
+        if new_folders:
+            first = len(self._folders)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_folders) - 1)
+            for folder, n in new_folders:
+                self._rows[folder] = len(self._folders)
+                self._folders.append(folder)
+                self._counts.append(n)
+            self.endInsertRows()
 
 
 class OrganizerWidget(QWidget):
     # Emit signal when done or closed if we want main window to know
     finished = Signal() 
+    
+    # Dispatch jobs to the persistent worker thread
+    _do_scan = Signal(object, object) # sorter, src_root
+    _do_sort = Signal(object, object) # sorter, plan
+    _do_plan = Signal(object, object, object, object) # sorter, files, metas, cache key
 
     def __init__(self, parent=None, language='ko'):
         super().__init__(parent)
-        self.lang = language
-        self.tr = TRANSLATIONS.get(language, TRANSLATIONS['en'])
+        self._bind_translations(language)
         
         self.sorter_config = {
             "dest_root": "",
             "structure": ["date", "camera", "kind"],
             "action": "copy",
             "policy": "rename", # Default safe policy
-            "skip_hash_dup": False
+            "skip_hash_dup": False,
+            "workers": os.cpu_count() or 1
         }
         
         self.current_files = []
-        self.current_metas = []
+        self.current_metas = MetaTable()
         self.current_plan = {}
-        
-        self.worker_thread = None
+        self._plan_model = PlanModel(self)
+        self._last_cfg_sig = None
+        self._populate_gen = 0
+        self._populate_items = []
+        self._populate_idx = 0
+        # Source folder, resolved once when it is chosen (see set_source)
+        self._src_path: Path | None = None
+        self._src_valid = False
+        self._busy = False # a scan/sort is queued or running on worker_thread
+        self._cached_dest_name = "Target" # preview name for the destination, set by browse_dst
+        # Plans for the current scan, keyed by (structure, dest_root, files signature)
+        self._plan_cache = OrderedDict()
+        self._files_sig = None
+        self._current_plan_key = None # _plan_key() that current_plan was built for
+        self._scan_dedup = None # skip_hash_dup the current files were scanned with
+        self._confirm_box = None # message boxes are created on first use and reused
+        self._info_box = None
+        self._last_scaled = -1
+        
+        # One worker thread for the whole session; scans/sorts are queued onto it
+        self.worker_thread = QThread(self)
+        self.worker = Worker()
+        self.worker.moveToThread(self.worker_thread)
+        self._do_scan.connect(self.worker.run_scan_with)
+        self._do_sort.connect(self.worker.run_sort_with)
+        self._do_plan.connect(self.worker.run_plan_with)
+        self.worker.progress.connect(self.update_progress)
+        self.worker.scan_chunk.connect(self.on_scan_chunk)
+        self.worker.scan_result.connect(self.on_scan_finished)
+        self.worker.sort_result.connect(self.on_sort_finished)
+        self.worker.plan_result.connect(self.on_plan_finished)
+        self.worker.error.connect(self.on_worker_error)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        # Started on first use (see start_scan)
         
         # External widget references (will be set by main window)
-        self.ext_tree: QTreeWidget | None = None
+        self.ext_tree: QTreeView | None = None
         self.ext_log: QTextEdit | None = None
         self.ext_progress: QProgressBar | None = None
+        
+        # Log lines are buffered and appended to ext_log in one go every 100 ms
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Structure edits come in bursts (drag, check storms); write QSettings once per burst
+        self._settings_dirty = False
+        self._last_saved_structure: list[str] | None = None
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(200)
+        self._settings_timer.timeout.connect(self._flush_settings)
 
         self._load_settings() # Load before UI setup
         self._setup_ui()
         # Style sheet will be inherited or set by parent, but we can enforce dark style for components
         # self.setStyleSheet(DARK_STYLE) 
         
-    def set_external_widgets(self, tree: QTreeWidget, log_text: QTextEdit, progress: QProgressBar):
+    def set_external_widgets(self, tree: QTreeView, log_text: QTextEdit, progress: QProgressBar):
         self.ext_tree = tree
         self.ext_log = log_text
         self.ext_progress = progress
         
-        # Setup tree columns if needed
+        # The tree is a plain view over the plan model
         if self.ext_tree:
-            self.ext_tree.setHeaderLabels(["Folder", "Files"])
+            self.ext_tree.setModel(self._plan_model)
+            self.ext_tree.setRootIsDecorated(False)
+            self.ext_tree.setUniformRowHeights(True)
 
-    def _t(self, key):
-        return self.tr.get(key, key)
+    def _bind_translations(self, language):
+        """Select the translation table and (re)bind the _t lookup."""
+        self.lang = language
+        self.tr = TRANSLATIONS.get(language, TRANSLATIONS['en'])
+        tr = self.tr
+        # Bound C-level __getitem__; only a miss drops into Python (__missing__)
+        self._t = _TranslationTable(tr).__getitem__
+        # Attribute access for widget text fixed at build time; English fills any gaps
+        self.T = SimpleNamespace(**{**TRANSLATIONS['en'], **tr})
 
     def _load_settings(self):
         settings = QSettings("SSC", "Organizer")
@@ -111,6 +352,8 @@ class OrganizerWidget(QWidget):
         # Let's use a simple format: "key:1" or "key:0" string list.
         
         saved_structure = settings.value("structure", [])
+        # What is on disk right now, so _save_settings can skip no-op writes
+        self._last_saved_structure = list(saved_structure) if saved_structure else None
         
         # Default if empty (First Run)
         if not saved_structure:
@@ -134,18 +377,9 @@ class OrganizerWidget(QWidget):
                 seen_keys.add(key)
         
         # Add any missing keys (future proofing)
-        all_keys = {
-            "date": "날짜 (YYYY-MM-DD)",
-            "camera": "카메라 모델",
-            "kind": "파일 종류 (RAW/JPG)",
-            "year": "연도 (YYYY)",
-            "month": "월 (YYYY-MM)",
-            "lens": "렌즈 모델"
-        }
-        
-        for key in all_keys:
-            if key not in seen_keys:
-                parsed_data.append((key, False))
+        missing = _KEY_LABELS.keys() - seen_keys
+        if missing:
+            parsed_data.extend((key, False) for key in _ALL_KEYS if key in missing)
         
         # Store for _setup_ui to use
         self._initial_structure = parsed_data
@@ -160,8 +394,26 @@ class OrganizerWidget(QWidget):
             key = item.data(Qt.UserRole)
             checked = "1" if item.checkState() == Qt.Checked else "0"
             data.append(f"{key}:{checked}")
-            
+        
+        if data == self._last_saved_structure:
+            return False
+        self._last_saved_structure = data
         settings.setValue("structure", data)
+        return True
+
+    def _on_structure_changed(self, *args):
+        self._update_preview()
+        self._schedule_save()
+
+    def _schedule_save(self, *args):
+        self._settings_dirty = True
+        self._settings_timer.start()
+
+    def _flush_settings(self):
+        if not self._settings_dirty: return
+        self._settings_dirty = False
+        if self._save_settings():
+            QSettings("SSC", "Organizer").sync()
 
     def _setup_ui(self):
         main_layout = QVBoxLayout(self)
@@ -174,13 +426,13 @@ class OrganizerWidget(QWidget):
         
         # Bottom Buttons
         btn_layout = QHBoxLayout()
-        self.btn_scan = QPushButton("스캔 시작")
+        self.btn_scan = QPushButton(self.T.org_btn_scan)
         self.btn_scan.clicked.connect(self.start_scan)
-        self.btn_start = QPushButton("이동 시작")
+        self.btn_start = QPushButton(self.T.org_btn_start)
         self.btn_start.clicked.connect(self.start_sort)
         self.btn_start.setEnabled(False)
         
-        self.btn_close = QPushButton("닫기") 
+        self.btn_close = QPushButton(self.T.org_btn_close)
         self.btn_close.clicked.connect(self.finished.emit)
         
         btn_layout.addStretch()
@@ -193,9 +445,9 @@ class OrganizerWidget(QWidget):
         layout = QVBoxLayout(parent)
         
         # Source
-        src_grp = QGroupBox("원본 폴더 선택")
+        src_grp = QGroupBox(self.T.org_src_group)
         src_layout = QHBoxLayout()
-        self.lbl_src = QLabel("선택된 폴더 없음")
+        self.lbl_src = QLabel(self.T.org_no_folder)
         btn_src = QPushButton("...")
         btn_src.setFixedWidth(40)
         btn_src.clicked.connect(self.browse_src)
@@ -205,9 +457,9 @@ class OrganizerWidget(QWidget):
         layout.addWidget(src_grp)
         
         # Dest
-        dst_grp = QGroupBox("타겟 폴더 선택")
+        dst_grp = QGroupBox(self.T.org_dst_group)
         dst_layout = QHBoxLayout()
-        self.lbl_dst = QLabel("선택된 폴더 없음")
+        self.lbl_dst = QLabel(self.T.org_no_folder)
         btn_dst = QPushButton("...")
         btn_dst.setFixedWidth(40)
         btn_dst.clicked.connect(self.browse_dst)
@@ -217,11 +469,11 @@ class OrganizerWidget(QWidget):
         layout.addWidget(dst_grp)
         
         # Options
-        opt_grp = QGroupBox("설정")
+        opt_grp = QGroupBox(self.T.org_settings)
         opt_layout = QVBoxLayout()
         
         # Sorting Structure (Reorderable List)
-        lbl_struct = QLabel("폴더 구조 (드래그하여 순서 변경):")
+        lbl_struct = QLabel(self.T.org_structure_hint)
         opt_layout.addWidget(lbl_struct)
         
         self.list_structure = QListWidget()
@@ -229,16 +481,17 @@ class OrganizerWidget(QWidget):
         # Expansion Fix: Use Minimum Height and remove fixed limit
         self.list_structure.setMinimumHeight(400) 
         
+        # Connect signals for live preview AND persistence
+        self.list_structure.model().rowsMoved.connect(self._on_structure_changed) # Reorder
+        self.list_structure.itemChanged.connect(self._on_structure_changed) # Check/uncheck
+        
+        # Populate silently; the preview is refreshed once at the end of this method
+        self.list_structure.blockSignals(True)
+        
         # Use loaded structure
         # Map keys back to labels
-        key_label_map = {
-            "date": "날짜 (YYYY-MM-DD)",
-            "camera": "카메라 모델",
-            "kind": "파일 종류 (RAW/JPG)",
-            "year": "연도 (YYYY)",
-            "month": "월 (YYYY-MM)",
-            "lens": "렌즈 모델"
-        }
+        T = self.T
+        key_label_map = {key: getattr(T, attr) for key, attr in _KEY_LABELS.items()}
 
         # Use self._initial_structure populated in _load_settings
         if hasattr(self, '_initial_structure'):
@@ -251,62 +504,38 @@ class OrganizerWidget(QWidget):
         else:
              # Fallback (Should not happen if _load_settings called)
              tokens = [
-                ("날짜 (YYYY-MM-DD)", "date", True),
-                ("카메라 모델", "camera", True),
-                ("파일 종류 (RAW/JPG)", "kind", True),
-                ("연도 (YYYY)", "year", False),
-                ("월 (YYYY-MM)", "month", False),
-                ("렌즈 모델", "lens", False),
+                (T.struct_date, "date", True),
+                (T.struct_camera, "camera", True),
+                (T.struct_kind, "kind", True),
+                (T.struct_year, "year", False),
+                (T.struct_month, "month", False),
+                (T.struct_lens, "lens", False),
              ]
              for label, key, checked in tokens:
                 item = QListWidgetItem(label)
                 item.setData(Qt.UserRole, key)
                 item.setCheckState(Qt.Checked if checked else Qt.Unchecked)
                 self.list_structure.addItem(item)
-            
+        
+        self.list_structure.blockSignals(False)
         opt_layout.addWidget(self.list_structure)
         
         # Preview Label
-        self.lbl_preview = QLabel("예상 경로: ...")
+        self.lbl_preview = QLabel(T.org_preview_path.format(path="..."))
         self.lbl_preview.setStyleSheet("color: #4CAF50; font-weight: bold; margin-top: 5px;")
         self.lbl_preview.setWordWrap(True)
         opt_layout.addWidget(self.lbl_preview)
 
-        # Connect signals for live preview
-        # Connect signals for live preview AND persistence
-        self.list_structure.model().rowsMoved.connect(self._update_preview)
-        self.list_structure.model().rowsMoved.connect(self._save_settings) # Auto-save on reorder
-        
-        self.list_structure.itemChanged.connect(self._update_preview)
-        self.list_structure.itemChanged.connect(self._save_settings) # Auto-save on check/uncheck
-
         # Action
         row3 = QHBoxLayout()
-        row3.addWidget(QLabel("작업:"))
+        row3.addWidget(QLabel(T.org_action))
         self.bg_action = QButtonGroup(self)
-        rb_copy = QRadioButton("복사 (Copy)")
-        rb_move = QRadioButton("이동 (Move)")
-        
-        # Style for Green Indicator
-        rb_style = """
-            QRadioButton::indicator:checked {
-                background-color: #4CAF50;
-                border: 2px solid #4CAF50;
-                border-radius: 6px;
-                image: none;
-            }
-            QRadioButton::indicator:unchecked {
-                background-color: transparent;
-                border: 2px solid #888;
-                border-radius: 6px;
-            }
-            QRadioButton::indicator {
-                width: 12px;
-                height: 12px;
-            }
-        """
-        rb_copy.setStyleSheet(rb_style)
-        rb_move.setStyleSheet(rb_style)
+        rb_copy = QRadioButton(T.org_copy)
+        rb_move = QRadioButton(T.org_move)
+        
+        # Green indicator comes from the QRadioButton#GreenRadio rule in DARK_STYLE
+        rb_copy.setObjectName("GreenRadio")
+        rb_move.setObjectName("GreenRadio")
 
         rb_copy.setChecked(True)
         self.bg_action.addButton(rb_copy, 1)
@@ -317,13 +546,19 @@ class OrganizerWidget(QWidget):
         
         # Policy
         row4 = QHBoxLayout()
-        row4.addWidget(QLabel("중복 처리:"))
+        row4.addWidget(QLabel(T.org_dup_policy))
         self.combo_policy = QComboBox()
-        self.combo_policy.addItem("이름 변경 (Rename)", "rename") 
-        self.combo_policy.addItem("건너뛰기 (Skip)", "skip")
+        self.combo_policy.addItem(T.org_policy_rename, "rename")
+        self.combo_policy.addItem(T.org_policy_skip, "skip")
         row4.addWidget(self.combo_policy)
         opt_layout.addLayout(row4)
         
+        # Content-hash dedup (reads every file once more, so opt-in)
+        self.chk_dedup = QCheckBox(T.org_dedup)
+        self.chk_dedup.setChecked(self.sorter_config["skip_hash_dup"])
+        self.chk_dedup.stateChanged.connect(self._on_dedup_changed)
+        opt_layout.addWidget(self.chk_dedup)
+        
         opt_grp.setLayout(opt_layout)
         layout.addWidget(opt_grp)
         
@@ -336,151 +571,269 @@ class OrganizerWidget(QWidget):
 
     def log(self, msg):
         if self.ext_log:
-            self.ext_log.append(msg)
+            self._log_buf.append(msg)
+            if not self._log_timer.isActive():
+                self._log_timer.start()
         else:
             print(f"[Organizer Log] {msg}")
 
+    def _flush_log(self):
+        if not self._log_buf or not self.ext_log: return
+        self.ext_log.append("\n".join(self._log_buf))
+        self._log_buf.clear()
+
     def browse_src(self):
         d = QFileDialog.getExistingDirectory(self, self._t("select_folder"))
         if d:
-            self.lbl_src.setText(d)
+            self.set_source(d)
             self.btn_start.setEnabled(False)
 
+    def set_source(self, folder):
+        """Set the source folder label and cache its Path / validity for start_scan."""
+        self.lbl_src.setText(str(folder))
+        self._src_path = Path(folder)
+        self._src_valid = os.path.isdir(folder)
+
     def browse_dst(self):
         d = QFileDialog.getExistingDirectory(self, self._t("dest_folder"))
         if d:
             self.lbl_dst.setText(d)
             self.sorter_config["dest_root"] = d
+            self._cached_dest_name = Path(d).name or d
+            self._update_preview()
+
+    def _on_dedup_changed(self, state):
+        self.sorter_config["skip_hash_dup"] = self.chk_dedup.isChecked()
 
     def _update_config(self):
         # Build structure list from checked items in order
-        structure = []
-        for i in range(self.list_structure.count()):
-            item = self.list_structure.item(i)
-            if item.checkState() == Qt.Checked:
-                structure.append(item.data(Qt.UserRole))
+        lst = self.list_structure
+        items = [lst.item(i) for i in range(lst.count())]
+        structure = [it.data(Qt.UserRole) for it in items if it.checkState() == Qt.Checked]
+        action = "move" if self.bg_action.checkedId() == 2 else "copy"
+        policy = self.combo_policy.currentData()
+        
+        # Skip the reassignment when nothing changed since the last start
+        sig = (tuple(structure), action, policy,
+               self.sorter_config["dest_root"], self.sorter_config["skip_hash_dup"])
+        if sig == self._last_cfg_sig:
+            return
+        self._last_cfg_sig = sig
         
         self.sorter_config["structure"] = structure
-        self.sorter_config["action"] = "move" if self.bg_action.checkedId() == 2 else "copy"
-        self.sorter_config["policy"] = self.combo_policy.currentData()
+        self.sorter_config["action"] = action
+        self.sorter_config["policy"] = policy
 
     def _update_preview(self, *args):
         # Generate dummy path based on current customized structure
-        parts = []
-        dest_root = self.lbl_dst.text()
-        if not dest_root or dest_root == "선택된 폴더 없음":
-            dest_root = "Target"
-        else:
-            dest_root = Path(dest_root).name
+        parts = [self._cached_dest_name]
         
-        parts.append(dest_root)
-
-        for i in range(self.list_structure.count()):
-            item = self.list_structure.item(i)
+        lst = self.list_structure
+        for i in range(lst.count()):
+            item = lst.item(i)
             if item.checkState() == Qt.Checked:
-                key = item.data(Qt.UserRole)
-                if key == "date": val = "2023-12-25"
-                elif key == "year": val = "2023"
-                elif key == "month": val = "2023-12"
-                elif key == "camera": val = "OM-1"
-                elif key == "lens": val = "M.Zuiko_12-40mm_Pro"
-                elif key == "kind": val = "RAW"
-                elif key == "ext": val = "ORF"
-                else: val = "Unknown"
-                parts.append(val)
+                parts.append(_PREVIEW_VALUES.get(item.data(Qt.UserRole), "Unknown"))
         
         parts.append("P123456.ORF")
         preview_str = " / ".join(parts)
-        self.lbl_preview.setText(f"예상 경로: {preview_str}")
+        self.lbl_preview.setText(self.T.org_preview_path.format(path=preview_str))
 
     def start_scan(self):
-        src = self.lbl_src.text()
-        if not src or not Path(src).exists():
+        if self._busy: return
+        if not self._src_valid:
             QMessageBox.warning(self, "Error", self._t("error_invalid_folder") if "error_invalid_folder" in self.tr else "Invalid Folder")
             return
             
         self._update_config()
         self.log("Starting scan...")
-        self.log("Starting scan...")
         # self.tabs.setCurrentIndex(2) # External log handling
         
         self.sorter = Sorter(self.sorter_config)
-        self.thread = QThread()
-        self.worker = Worker(self.sorter, mode='scan')
-        self.worker.src_root = Path(src)
-        self.worker.moveToThread(self.thread)
-        self.worker_thread = self.thread # Keep ref
+        self._scan_dedup = self.sorter_config["skip_hash_dup"]
         
-        self.thread.started.connect(self.worker.run_scan)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.scan_result.connect(self.on_scan_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.finished.connect(self._on_thread_finished)
-        
-        self.thread.start()
+        self.current_files = []
+        self.current_metas = MetaTable()
+        self._populate_gen += 1 # drop any in-flight tree population
+        self._plan_model.clear()
+        self._last_scaled = -1
+        
+        if not self.worker_thread.isRunning():
+            self.worker_thread.start()
+        self._busy = True
+        self._do_scan.emit(self.sorter, self._src_path)
         self.btn_scan.setEnabled(False)
+        self.btn_start.setEnabled(False)
     
-    def _on_thread_finished(self):
-        self.worker_thread = None
+    def shutdown(self):
+        """Stop the worker thread (call when the owning window closes)."""
+        self._settings_timer.stop()
+        self._flush_settings()
+        if self.worker_thread.isRunning():
+            if self._busy and self.sorter is not None:
+                # Every job gets self.sorter, so this also stops one still queued on the thread
+                self.sorter.cancel()
+            self.worker_thread.quit()
+            if not self.worker_thread.wait(SHUTDOWN_WAIT_MS):
+                # Still inside one file operation after the cancel; don't hang the close on it
+                self.worker_thread.terminate()
+                self.worker_thread.wait()
+
+    def on_worker_error(self, msg):
+        self._busy = False
+        self.log(f"Error: {msg}")
+        self.btn_scan.setEnabled(True)
+        self.btn_start.setEnabled(bool(self.current_plan))
 
     def update_progress(self, status, current, total):
-        if self.ext_progress:
-            self.ext_progress.setFormat("%v / %m (%p%)")
-            self.ext_progress.setMaximum(total)
-            self.ext_progress.setValue(current)
-
-    def on_scan_finished(self, files, metas):
+        if not self.ext_progress: return
+        # Fixed 0-1000 range: the bar only repaints when a permille step is crossed
+        scaled = (current * 1000) // max(total, 1)
+        if scaled == self._last_scaled:
+            return
+        self._last_scaled = scaled
+        self.ext_progress.setFormat(f"{current} / {total} (%p%)")
+        self.ext_progress.setMaximum(1000)
+        self.ext_progress.setValue(scaled)
+
+    def on_scan_chunk(self, files, metas, counts):
+        # Partial results: grow the preview tree as batches arrive (grouped on the worker)
+        self.current_files.extend(files)
+        self.current_metas.extend(metas)
+        self._plan_model.add_counts(counts)
+
+    def on_scan_finished(self, files, metas, plan):
+        self._busy = False
         self.current_files = files
         self.current_metas = metas
         self.log(f"Scan complete. Found {len(files)} files.")
         
-        self.current_plan = self.sorter.plan_sort(files, metas)
-        self._populate_tree(self.current_plan)
+        self._files_sig = hash(tuple(files))
+        self._plan_cache.clear()
+        key = self._plan_key(self.sorter)
+        self._cache_plan(key, plan)
+        self._current_plan_key = key
+        self.current_plan = plan
+        # Grouping is per file, so the streamed chunks normally add up to this plan already
+        if not self._plan_model.matches(plan):
+            self._populate_tree(plan)
         
         self.btn_scan.setEnabled(True)
         self.btn_start.setEnabled(True)
         # self.tabs.setCurrentIndex(1) # External preview handling
 
     def _populate_tree(self, plan):
-        if not self.ext_tree: return
-        self.ext_tree.clear()
-        for folder, files in plan.items():
-            item = QTreeWidgetItem(self.ext_tree)
-            item.setText(0, str(folder))
-            item.setText(1, f"{len(files)} files")
+        # Fill the model in slices from the event loop so huge plans don't freeze input
+        self._populate_gen += 1
+        self._populate_items = list(plan.items())
+        self._populate_idx = 0
+        tree = self.ext_tree
+        if tree: tree.setUpdatesEnabled(False)
+        self._plan_model.clear()
+        if tree: tree.setUpdatesEnabled(True)
+        gen = self._populate_gen
+        QTimer.singleShot(0, lambda: self._populate_chunk(gen))
+
+    def _populate_chunk(self, gen):
+        if gen != self._populate_gen: return # superseded by a newer plan
+        start = self._populate_idx
+        batch = self._populate_items[start:start + POPULATE_CHUNK]
+        self._populate_idx = start + len(batch)
+        self._plan_model.add_counts({str(folder): len(files) for folder, files in batch})
+        if self._populate_idx < len(self._populate_items):
+            QTimer.singleShot(0, lambda: self._populate_chunk(gen))
+        else:
+            self._populate_items = []
             
+    def _plan_key(self, sorter):
+        # Only what plan_sort reads; action/policy don't change the plan, dedup is a scan option
+        return (tuple(sorter.structure), str(sorter.dest_root), self._files_sig)
+
+    def _cache_plan(self, key, plan):
+        self._plan_cache[key] = plan
+        self._plan_cache.move_to_end(key)
+        while len(self._plan_cache) > 4:
+            self._plan_cache.popitem(last=False)
+
+    def _set_plan(self, key, plan):
+        self._current_plan_key = key
+        if plan is not self.current_plan:
+            self.current_plan = plan
+            self._populate_tree(plan)
+
+    def _replan_if_changed(self):
+        """
+        Options changed since the scan: re-plan the scanned files instead of rescanning.
+        Returns True when the plan is being rebuilt on the worker (see on_plan_finished).
+        """
+        key = self._plan_key(self.sorter)
+        if key == self._current_plan_key:
+            return False
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            self._set_plan(key, plan)
+            return False
+        
+        self.log("Re-planning...")
+        self._busy = True
+        self.btn_scan.setEnabled(False)
+        self.btn_start.setEnabled(False)
+        self._do_plan.emit(self.sorter, self.current_files, self.current_metas, key)
+        return True
+
+    def on_plan_finished(self, key, plan):
+        self._busy = False
+        self._cache_plan(key, plan)
+        self._set_plan(key, plan)
+        self.btn_scan.setEnabled(True)
+        self._confirm_sort()
+
     def start_sort(self):
-        if not self.current_plan:
+        if self._busy or not self.current_plan:
             return
-        
-        ret = QMessageBox.question(self, "Confirm", f"Execute {self.sorter_config['action']}?")
-        if ret != QMessageBox.Yes:
+        self._update_config()
+        if self.sorter_config["skip_hash_dup"] != self._scan_dedup:
+            # Duplicates are dropped while scanning, so the scanned file list is stale
+            self.log("Duplicate check changed since the scan; rescanning.")
+            self.start_scan()
+            return
+        self.sorter = Sorter(self.sorter_config) # picks up action/policy changes
+        if self._replan_if_changed():
+            return
+        self._confirm_sort()
+
+    def _confirm_sort(self):
+        # Window-modal but non-blocking: queued worker signals keep flowing while it is up
+        box = self._confirm_box
+        if box is None:
+            box = self._confirm_box = QMessageBox(QMessageBox.Question, "Confirm", "",
+                                                  QMessageBox.Yes | QMessageBox.No, self)
+            box.finished.connect(self._on_confirm_sort)
+        box.setText(f"Execute {self.sorter_config['action']}?")
+        self.btn_start.setEnabled(False)
+        box.open()
+
+    def _on_confirm_sort(self, result):
+        box = self._confirm_box
+        if box.standardButton(box.clickedButton()) != QMessageBox.Yes:
+            self.btn_start.setEnabled(bool(self.current_plan))
             return
             
         self.log("Starting sort...")
+        self._last_scaled = -1
         # self.tabs.setCurrentIndex(2)
         
-        self.thread = QThread()
-        self.worker = Worker(self.sorter, mode='sort')
-        self.worker.plan = self.current_plan
-        self.worker.moveToThread(self.thread)
-        self.worker_thread = self.thread
-        
-        self.thread.started.connect(self.worker.run_sort)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.sort_result.connect(self.on_sort_finished)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-        self.thread.finished.connect(self._on_thread_finished)
-        
-        self.thread.start()
+        self._busy = True
+        self._do_sort.emit(self.sorter, self.current_plan)
         self.btn_start.setEnabled(False)
 
     def on_sort_finished(self, result):
+        self._busy = False
         self.log("Sort complete.")
         self.log(str(result))
-        QMessageBox.information(self, "Done", "Sorting complete!")
+        box = self._info_box
+        if box is None:
+            box = self._info_box = QMessageBox(QMessageBox.Information, "Done", "Sorting complete!",
+                                               QMessageBox.Ok, self)
+        box.open()
         self.btn_start.setEnabled(True)
@@ -153,5 +153,22 @@ QRubberBand {
 QLabel {
     color: #cccccc;
 }
+
+/* --- Green Radio (Organizer action) --- */
+QRadioButton#GreenRadio::indicator {
+    width: 12px;
+    height: 12px;
+}
+QRadioButton#GreenRadio::indicator:checked {
+    background-color: #4CAF50;
+    border: 2px solid #4CAF50;
+    border-radius: 6px;
+    image: none;
+}
+QRadioButton#GreenRadio::indicator:unchecked {
+    background-color: transparent;
+    border: 2px solid #888;
+    border-radius: 6px;
+}
 """
 
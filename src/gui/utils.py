@@ -1,23 +1,39 @@
+import numpy as np
 from PIL import Image
 from PySide6.QtGui import QImage, QPixmap
 
-def pil_to_qimage(img: Image.Image) -> QImage:
-    if img.mode in ("P", "RGBA"):
-        img = img.convert("RGBA")
-        fmt = QImage.Format_RGBA8888
-        bpp = 4
-    elif img.mode != "RGB":
-        img = img.convert("RGB")
-        fmt = QImage.Format_RGB888
-        bpp = 3
-    else:
-        fmt = QImage.Format_RGB888
-        bpp = 3
+# PIL modes Qt can wrap as-is, no convert() pass needed
+_DIRECT_FORMATS = {
+    "L": QImage.Format_Grayscale8,
+    "RGB": QImage.Format_RGB888,
+    "RGBA": QImage.Format_RGBA8888,
+}
+
+def pil_to_qimage(img: Image.Image, copy: bool = True) -> QImage:
+    """
+    copy=False skips the defensive deep copy and returns a QImage that views the
+    pixel array, which is kept alive as an attribute of the returned wrapper. The
+    pixels stay valid exactly as long as that Python object does, so it may cross
+    threads only as the same object (an `object`-typed signal argument, not a
+    QImage-typed one, which would re-wrap it), and receivers should convert it
+    (e.g. QPixmap.fromImage) rather than keep shallow QImage copies of it.
+    """
+    fmt = _DIRECT_FORMATS.get(img.mode)
+    if fmt is None:
+        if img.mode == "P":
+            img = img.convert("RGBA")
+            fmt = QImage.Format_RGBA8888
+        else:
+            img = img.convert("RGB")
+            fmt = QImage.Format_RGB888
 
     w, h = img.size
     try:
-        data = img.tobytes("raw", img.mode)
-        qimg = QImage(data, w, h, w * bpp, fmt)
+        arr = np.ascontiguousarray(np.asarray(img), dtype=np.uint8)
+        qimg = QImage(arr.data, w, h, arr.strides[0], fmt)
+        if not copy:
+            qimg._arr = arr
+            return qimg
         return qimg.copy()
     except Exception:
         # Fallback for weird modes or errors
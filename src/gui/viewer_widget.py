@@ -7,6 +7,12 @@ from PySide6.QtGui import QColor, QPalette, QIcon, QAction, QPixmap
 from .widgets import GPUImageWidget
 from pathlib import Path
 
+# Parsed once on the star container; buttons switch via the "active" property
+_STAR_STYLE = """
+QPushButton#StarButton { color: #555555; font-size: 24pt; background: transparent; border: none; }
+QPushButton#StarButton[active="true"] { color: #FFD700; }
+"""
+
 class FullViewerWidget(QWidget):
     request_next = Signal()
     request_prev = Signal()
@@ -93,13 +99,16 @@ class FullViewerWidget(QWidget):
 
         # Rating Stars
         self.star_buttons = []
+        self._star_active_state = [False] * 5 # last style applied per button
         star_container = QWidget()
+        star_container.setStyleSheet(_STAR_STYLE)
         star_layout = QHBoxLayout(star_container)
         for i in range(1, 6):
             btn = QPushButton("★")
             btn.setCheckable(True)
             btn.setFixedSize(50, 50)
-            btn.setStyleSheet(self._get_star_style(False))
+            btn.setObjectName("StarButton")
+            btn.setProperty("active", False)
             btn.clicked.connect(lambda checked, r=i: self.set_rating(r))
             self.star_buttons.append(btn)
             star_layout.addWidget(btn)
@@ -111,12 +120,6 @@ class FullViewerWidget(QWidget):
 
 
 
-    def _get_star_style(self, active):
-        if active:
-            return "color: #FFD700; font-size: 24pt; background: transparent; border: none;"
-        else:
-            return "color: #555555; font-size: 24pt; background: transparent; border: none;"
-
     def resizeEvent(self, event):
         super().resizeEvent(event)
         # Reposition Overlays
@@ -152,13 +155,21 @@ class FullViewerWidget(QWidget):
         self.rating_changed.emit(rating)
         self._update_star_ui(rating)
 
+    def show_rating(self, rating):
+        """Update the stars without emitting rating_changed."""
+        self._update_star_ui(rating)
+
     def _update_star_ui(self, rating):
+        state = self._star_active_state
         for i, btn in enumerate(self.star_buttons):
-            # Index 0 is 1 star.
-            if i < rating:
-                btn.setStyleSheet(self._get_star_style(True))
-            else:
-                btn.setStyleSheet(self._get_star_style(False))
+            # Index 0 is 1 star. Only repolish buttons whose state flips.
+            active = i < rating
+            if active != state[i]:
+                btn.setProperty("active", active)
+                style = btn.style()
+                style.unpolish(btn)
+                style.polish(btn)
+                state[i] = active
 
     def keyPressEvent(self, event):
         key = event.key()
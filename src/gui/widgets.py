@@ -1,19 +1,20 @@
-from pathlib import Path
+from collections import deque
 
 from PySide6.QtCore import (
-    Qt, QSize, QThread, Signal, QObject, QRect, QPoint, QTimer
+    Qt, QSize, Signal, Slot, QRect, QPoint, QTimer, QElapsedTimer, QMetaObject
 )
 from PySide6.QtGui import (
-    QPixmap, QDrag, QPainter, QColor, QPen, QTransform
+    QPixmap, QPixmapCache, QDrag, QPainter, QColor, QPen
 )
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem, QScrollArea, QApplication, QStyle, QRubberBand,
-    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QAbstractItemView
+    QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem, QScrollArea, QApplication, QRubberBand,
+    QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsItem, QAbstractItemView
 )
-from PySide6.QtOpenGLWidgets import QOpenGLWidget
 
-from ..core.image_loader import load_pil_image
-from .utils import pil_to_qimage
+
+def _epos(event) -> QPoint:
+    # Mouse event position in widget coordinates (PySide6 events always have position())
+    return event.position().toPoint()
 
 # ------------------------------------------------------------
 # 썸네일 생성 워커
@@ -28,6 +29,11 @@ from .utils import pil_to_qimage
 # 썸네일을 표시하는 커스텀 위젯
 # ------------------------------------------------------------
 class ThumbnailWidget(QWidget):
+    _RATING_STRINGS = ("", "★", "★★", "★★★", "★★★★", "★★★★★")
+    _STYLE_RATING = "color: #FFD700; font-size: 14pt; font-weight: bold;"
+    _STYLE_PAIRED = "color: #E0E0E0; font-size: 9pt; border-bottom: 3px solid #4CAF50; padding-bottom: 2px;"
+    _STYLE_UNPAIRED = "color: #E0E0E0; font-size: 9pt; border-bottom: none; padding-bottom: 2px;"
+
     def __init__(self, file_name: str, thumb_size: int, parent: QWidget | None = None):
         super().__init__(parent)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
@@ -58,71 +64,90 @@ class ThumbnailWidget(QWidget):
         # Star Rating Label
         self.rating_label = QLabel("")
         self.rating_label.setAlignment(Qt.AlignCenter)
-        self.rating_label.setStyleSheet("color: #FFD700; font-size: 14pt; font-weight: bold;")
+        self.rating_label.setStyleSheet(self._STYLE_RATING)
         self.rating_label.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         # self.rating_label.hide() # Hide until rated
         layout.addWidget(self.rating_label)
 
         self.is_paired = False
+        self._last_paired_state = None # style last applied to name_label
+        self.rating = 0
+        self._source_pixmap: QPixmap | None = None # rescale from this, not the label copy
+        # Deferred smooth pass, batched by the owning ImageListWidget (set in its setItemWidget)
+        self._smoother = None
 
     def set_rating(self, rating: int):
-        if rating > 0:
-            stars = "★" * rating
-            self.rating_label.setText(stars)
-            self.rating_label.show()
-        else:
-            self.rating_label.setText("")
-            self.rating_label.hide()
+        self.rating = rating
+        stars = self._RATING_STRINGS[rating] if 0 <= rating < 6 else "★" * rating
+        label = self.rating_label
+        if stars != label.text():
+            label.setText(stars)
+        label.setVisible(rating > 0)
 
     def set_paired(self, paired: bool):
         self.is_paired = paired
         self._update_style()
 
     def _update_style(self):
-        if self.is_paired:
-            # Green line at the bottom of the name label
-            self.name_label.setStyleSheet("color: #E0E0E0; font-size: 9pt; border-bottom: 3px solid #4CAF50; padding-bottom: 2px;")
-        else:
-            self.name_label.setStyleSheet("color: #E0E0E0; font-size: 9pt; border-bottom: none; padding-bottom: 2px;")
+        # setStyleSheet reparses and repolishes, so only touch it on a real change
+        if self.is_paired == self._last_paired_state: return
+        self._last_paired_state = self.is_paired
+        # Paired: green line at the bottom of the name label
+        self.name_label.setStyleSheet(self._STYLE_PAIRED if self.is_paired else self._STYLE_UNPAIRED)
 
     def set_pixmap(self, pixmap: QPixmap):
         if pixmap is not None and not pixmap.isNull():
-            self._current_pixmap = pixmap # Store original/current source if possible? 
-            # Storing full res pixmap for every item might be heavy if we had it?
-            # Actually set_pixmap receives the processed/loaded pixmap.
-            # If we store it, we can rescale from it without quality loss relative to "loaded" quality.
-            
-            # Use SmoothTransformation for high quality
-            scale_mode = Qt.SmoothTransformation
-            if self.thumb_size < 100: scale_mode = Qt.FastTransformation
-            
-            self.image_label.setPixmap(pixmap.scaled(
-                self.thumb_size,
-                self.thumb_size,
-                Qt.KeepAspectRatio,
-                scale_mode
-            ))
-            
+            # Keep the loaded pixmap so later rescales start from full loaded quality
+            self._source_pixmap = pixmap
+            self._rescale_fast()
+
     def update_thumb_size(self, size: int):
+        if size == self.thumb_size: return # nothing to relayout or rescale
         self.thumb_size = size
         self.image_label.setFixedSize(size, size)
         
-        # Rescale current content if available to prevent "Small Image in Big Box"
-        if self.image_label.pixmap() and not self.image_label.pixmap().isNull():
-            # We rescale the *currently displayed* pixmap. 
-            # Note: This might cause blurriness if upscaling significantly, 
-            # but it maintains layout until the high-res reload kicks in.
-            # Ideally we'd store the source pixmap, but we can just use the label's pixmap for now.
-            # Wait, label.pixmap() returns the scaled version.
-            # If we scale up from that, it gets blurry. That's fine for transition.
-            
-            current = self.image_label.pixmap()
-            self.image_label.setPixmap(current.scaled(
-                size,
-                size,
+        # Rescale current content if available to prevent "Small Image in Big Box".
+        # Upscaling may look soft until the high-res reload kicks in; that's fine for transition.
+        if self._source_pixmap is not None:
+            self._rescale_fast()
+
+    def _smooth_key(self, size: int) -> str:
+        # Shared across widgets: same source pixmap at the same size scales to the same bytes
+        return f"thumb:{self._source_pixmap.cacheKey()}:{size}"
+
+    def _rescale_fast(self):
+        # Nearest-neighbour now, smooth pass once resizing settles
+        size = self.thumb_size
+        if size >= 100:
+            cached = QPixmapCache.find(self._smooth_key(size))
+            if cached is not None and not cached.isNull():
+                self.image_label.setPixmap(cached)
+                return
+        self.image_label.setPixmap(self._source_pixmap.scaled(
+            size,
+            size,
+            Qt.KeepAspectRatio,
+            Qt.FastTransformation
+        ))
+        if size < 100: return # Fast is the final quality for tiny thumbs
+        if self._smoother is not None:
+            self._smoother(self)
+        else:
+            self._do_smooth_rescale()
+
+    def _do_smooth_rescale(self):
+        if self._source_pixmap is None: return
+        key = self._smooth_key(self.thumb_size)
+        scaled = QPixmapCache.find(key)
+        if scaled is None or scaled.isNull():
+            scaled = self._source_pixmap.scaled(
+                self.thumb_size,
+                self.thumb_size,
                 Qt.KeepAspectRatio,
                 Qt.SmoothTransformation
-            ))
+            )
+            QPixmapCache.insert(key, scaled)
+        self.image_label.setPixmap(scaled)
 
 
 # ------------------------------------------------------------
@@ -167,38 +192,59 @@ class ImageListWidget(QListWidget):
     doubleClickedLeft = Signal(QListWidgetItem)
     doubleClickedRight = Signal(QListWidgetItem)
 
+    # Drag preview overlay, built once
+    _DRAG_OVERLAY = QColor(0, 0, 0, 128)
+    _DRAG_PEN = QPen(Qt.white)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._thumb_size = 300
         self._grid_padding_w = 20
         self._grid_padding_h = 50
+        # Set by the window while a file filter hides items; hidden rows leave gaps in the grid
+        self.filter_active = False
         self._drag_start_pos: QPoint | None = None
-        self._rubber_band: QRubberBand | None = None
+        # One band for the widget's lifetime; shown while a band selection is in progress
+        self._rubber_band = QRubberBand(QRubberBand.Rectangle, self.viewport())
+        self._rubber_band.setStyleSheet("border: 2px dashed #4CAF50; background-color: rgba(76, 175, 80, 80);")
+        self._rubber_band.hide()
         self._rubber_start_pos: QPoint | None = None
+        self._last_band_rect: QRect | None = None # geometry last pushed to the band
         
         # Optimize Scrolling (User Request: Scroll was too jumpy)
         self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.setUniformItemSizes(True) # Better performance for fixed size grids
 
-        # Resize Throttling
+        # Resize Throttling: wheel ticks within one event-loop pass share a single queued commit
         self._target_thumb_size = self._thumb_size
-        self._resize_timer = QTimer(self)
-        self._resize_timer.setSingleShot(True)
-        self._resize_timer.setInterval(100) # 100ms delay
-        self._resize_timer.timeout.connect(self._apply_delayed_resize)
+        self._resize_queued = False
+
+        # Off-screen items are resized in idle slices after the visible ones
+        self._pending_resize = deque()
+        self._resize_chunk_timer = QTimer(self)
+        self._resize_chunk_timer.setInterval(0)
+        self._resize_chunk_timer.timeout.connect(self._resize_next_chunk)
+
+        # Tiles waiting for their smooth rescale; one list-wide timer instead of one per tile.
+        # A dict keeps scheduling order and drops repeats.
+        self._smooth_pending: dict[ThumbnailWidget, None] = {}
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._smooth_next_batch)
+
+        # Last drag preview as (key, pixmap); a repeated drag of the same selection reuses it
+        self._drag_cache: tuple[tuple, QPixmap] | None = None
+        self.itemSelectionChanged.connect(self._drop_drag_cache)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            if hasattr(event, 'position'):
-                pos = event.position().toPoint()
-            else:
-                pos = QPoint(event.x(), event.y())
-            
+            pos = _epos(event)
             item = self.itemAt(pos)
             
             # Logic Separation:
             # Item Clicked -> Potential Drag (No RubberBand)
             # Empty Space -> Potential RubberBand (No Drag)
+            self._last_band_rect = None
             if item is not None:
                 self._drag_start_pos = pos
                 self._rubber_start_pos = None
@@ -209,12 +255,7 @@ class ImageListWidget(QListWidget):
                 if not (event.modifiers() & Qt.ControlModifier):
                     self.clearSelection()
 
-        if hasattr(event, 'position'):
-            pos_for_mod = event.position().toPoint()
-        else:
-            pos_for_mod = QPoint(event.x(), event.y())
-
-        item = self.itemAt(pos_for_mod)
+        item = self.itemAt(_epos(event))
         if item is not None:
             self.clicked_with_modifiers.emit(item, event.modifiers())
         super().mousePressEvent(event)
@@ -227,13 +268,8 @@ class ImageListWidget(QListWidget):
             current = self.currentRow()
             if current < 0: current = 0
             
-            try:
-                grid_w = self.gridSize().width()
-            except Exception:
-                grid_w = self._thumb_size + self._grid_padding_w
-            
-            viewport_width = self.viewport().width()
-            columns = max(1, viewport_width // grid_w)
+            # Read live: two cheap calls per key press, and never stale after a resize/relayout
+            columns = max(1, self.viewport().width() // max(1, self.gridSize().width()))
             new_index = current
             
             if key == Qt.Key_Left: new_index = max(0, current - 1)
@@ -267,7 +303,7 @@ class ImageListWidget(QListWidget):
         super().keyPressEvent(event)
 
     def mouseMoveEvent(self, event):
-        current_pos = event.position().toPoint() if hasattr(event, 'position') else QPoint(event.x(), event.y())
+        current_pos = _epos(event)
 
         # Drag start logic
         if self._drag_start_pos is not None:
@@ -276,23 +312,24 @@ class ImageListWidget(QListWidget):
             if (current_pos - self._drag_start_pos).manhattanLength() >= threshold:
                 start_item = self.itemAt(self._drag_start_pos)
                 if start_item is not None and start_item.isSelected():
-                    if self._rubber_band is not None:
-                        self._rubber_band.hide()
-                        self._rubber_band = None
+                    self._rubber_band.hide()
                     self.startDrag(Qt.MoveAction)
                     self._drag_start_pos = None
                     return
 
         # Rubber band logic
         if self._rubber_start_pos is not None:
-            if self._rubber_band is None:
-                self._rubber_band = QRubberBand(QRubberBand.Rectangle, self.viewport())
-                self._rubber_band.setStyleSheet("border: 2px dashed #4CAF50; background-color: rgba(76, 175, 80, 80);")
+            if not self._rubber_band.isVisible():
                 self._rubber_band.show()
                 self._rubber_band.raise_()
             
+            # Coalesce sub-2px jitter; each setGeometry repaints the band area
             rect = QRect(self._rubber_start_pos, current_pos).normalized()
-            self._rubber_band.setGeometry(rect)
+            last = self._last_band_rect
+            if (last is None or abs(rect.left() - last.left()) >= 2 or abs(rect.top() - last.top()) >= 2
+                    or abs(rect.right() - last.right()) >= 2 or abs(rect.bottom() - last.bottom()) >= 2):
+                self._rubber_band.setGeometry(rect)
+                self._last_band_rect = rect
             return
 
         super().mouseMoveEvent(event)
@@ -300,19 +337,23 @@ class ImageListWidget(QListWidget):
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._drag_start_pos = None
-            if self._rubber_band is not None and self._rubber_start_pos is not None:
-                selection_rect = self._rubber_band.geometry()
+            if self._rubber_start_pos is not None and self._rubber_band.isVisible():
+                # Exact rect from the release point; the band itself may trail by a pixel
+                selection_rect = QRect(self._rubber_start_pos, _epos(event)).normalized()
+                self._last_band_rect = None
                 self._rubber_band.hide()
-                self._rubber_band.deleteLater()
-                self._rubber_band = None
 
                 modifiers = event.modifiers()
                 if not (modifiers & Qt.ControlModifier):
                     self.clearSelection()
 
-                for i in range(self.count()):
-                    item = self.item(i)
-                    if selection_rect.intersects(self.visualItemRect(item)):
+                # Only the grid cells under the band are candidates
+                _item = self.item
+                _rect = self.visualItemRect
+                hits = selection_rect.intersects
+                for i in self._cells_in_rect(selection_rect):
+                    item = _item(i)
+                    if hits(_rect(item)):
                         item.setSelected(True)
                 
                 self._rubber_start_pos = None
@@ -324,9 +365,10 @@ class ImageListWidget(QListWidget):
             delta_y = event.angleDelta().y()
             if delta_y == 0: return
 
-            factor = 1.1 if delta_y > 0 else 0.9
-            new_size = int(self._target_thumb_size * factor)
-            new_size = max(80, min(5000, new_size))
+            # Integer ~10% steps; shrinking by s//11 undoes growing by s//10, so zoom doesn't drift
+            size = self._target_thumb_size
+            step = max(8, size // 10) if delta_y > 0 else -max(8, size // 11)
+            new_size = max(80, min(5000, size + step))
             
             self._target_thumb_size = new_size
             
@@ -335,8 +377,10 @@ class ImageListWidget(QListWidget):
             grid_h = new_size + self._grid_padding_h
             self.setGridSize(QSize(grid_w, grid_h))
             
-            # Debounce expensive content resize
-            self._resize_timer.start()
+            # Coalesce expensive content resize into the next event-loop pass
+            if not self._resize_queued:
+                self._resize_queued = True
+                QMetaObject.invokeMethod(self, "_apply_delayed_resize", Qt.QueuedConnection)
             
             event.accept()
         else:
@@ -346,21 +390,15 @@ class ImageListWidget(QListWidget):
             delta = event.angleDelta().y()
             if delta == 0: return
             
-            # Factor: 0.5 means 60px move per click (if delta is 120)
-            # Adjust '0.4' to make it smoother/slower as requested
-            step = -int(delta * 0.4) 
+            # 2/5 of the delta: 48px move per click (if delta is 120), integer math only
+            step = -(delta * 2 // 5)
             
             sb = self.verticalScrollBar()
             sb.setValue(sb.value() + step)
             event.accept()
 
     def mouseDoubleClickEvent(self, event):
-        if hasattr(event, 'position'):
-            pos = event.position().toPoint()
-        else:
-            pos = QPoint(event.x(), event.y())
-        
-        item = self.itemAt(pos)
+        item = self.itemAt(_epos(event))
         if item:
             if event.button() == Qt.LeftButton:
                 self.doubleClickedLeft.emit(item)
@@ -368,12 +406,36 @@ class ImageListWidget(QListWidget):
                 self.doubleClickedRight.emit(item)
         super().mouseDoubleClickEvent(event)
 
+    def setItemWidget(self, item: QListWidgetItem, widget: QWidget):
+        super().setItemWidget(item, widget)
+        if type(widget) is ThumbnailWidget:
+            widget._smoother = self.schedule_smooth
+
+    def schedule_smooth(self, widget: ThumbnailWidget):
+        # Restarting the timer keeps smoothing off until rescaling has settled for 120 ms
+        self._smooth_pending[widget] = None
+        self._smooth_timer.start(120)
+
+    def _smooth_next_batch(self):
+        pending = self._smooth_pending
+        for _ in range(min(64, len(pending))):
+            widget = next(iter(pending))
+            del pending[widget]
+            try:
+                widget._do_smooth_rescale()
+            except RuntimeError:
+                pass # tile was deleted (list cleared) while waiting
+        if pending:
+            self._smooth_timer.start(0)
+
     def set_thumb_size(self, size: int):
         self._thumb_size = size
         self._target_thumb_size = size
         self._apply_delayed_resize()
 
+    @Slot()
     def _apply_delayed_resize(self):
+        self._resize_queued = False
         # Commit the target size
         self._thumb_size = self._target_thumb_size
         
@@ -381,19 +443,81 @@ class ImageListWidget(QListWidget):
         grid_w = self._thumb_size + self._grid_padding_w
         grid_h = self._thumb_size + self._grid_padding_h
         
+        self._cell_size = QSize(grid_w, grid_h) # shared by every setSizeHint below
         self.setIconSize(icon_size)
-        self.setGridSize(QSize(grid_w, grid_h))
-
-        # Expensive loop (run only once after scrolling stops)
-        for i in range(self.count()):
-            item = self.item(i)
-            widget = self.itemWidget(item)
-            if isinstance(widget, ThumbnailWidget):
-                widget.update_thumb_size(self._thumb_size)
-            item.setSizeHint(QSize(grid_w, grid_h))
+        self.setGridSize(self._cell_size)
+
+        # Visible items now, the rest from the event loop so the zoom lands at once
+        count = self.count()
+        view_rect = self.viewport().rect()
+        _item = self.item
+        _rect = self.visualItemRect
+        on_screen = view_rect.intersects
+        # Grid candidates narrowed to tiles really on screen (hidden rows have no rect)
+        visible = [i for i in self._cells_in_rect(view_rect) if on_screen(_rect(_item(i)))]
+        self.setUpdatesEnabled(False)
+        self._resize_items(visible)
+        self.setUpdatesEnabled(True)
+
+        done = set(visible)
+        self._pending_resize = deque(i for i in range(count) if i not in done)
+        if self._pending_resize:
+            self._resize_chunk_timer.start()
+        else:
+            self._resize_chunk_timer.stop()
             
         self.thumbSizeChanged.emit(self._thumb_size)
 
+    def _resize_next_chunk(self):
+        pending = self._pending_resize
+        count = self.count()
+        popleft = pending.popleft
+        batch = [i for i in (popleft() for _ in range(min(64, len(pending)))) if i < count]
+        self._resize_items(batch)
+        if not pending:
+            self._resize_chunk_timer.stop()
+
+    def _resize_items(self, indices):
+        # Hot loop: bind lookups once, exact type check instead of isinstance
+        _item = self.item
+        _iw = self.itemWidget
+        size_hint = self._cell_size
+        thumb_size = self._thumb_size
+        for i in indices:
+            item = _item(i)
+            widget = _iw(item)
+            if type(widget) is ThumbnailWidget:
+                widget.update_thumb_size(thumb_size)
+            item.setSizeHint(size_hint)
+
+    def _cells_in_rect(self, rect: QRect):
+        # Candidate item indices under a viewport rect; callers confirm with visualItemRect.
+        # Origin and stride are measured from the laid-out items, so spacing is included.
+        # Hidden (filtered) items break the row-major arithmetic, so then all are candidates.
+        count = self.count()
+        if count == 0: return []
+        if self.filter_active: return range(count)
+        _rect = self.visualItemRect
+        _item = self.item
+        first = _rect(_item(0))
+        columns = 1
+        while columns < count and _rect(_item(columns)).top() == first.top():
+            columns += 1
+        step_x = _rect(_item(1)).left() - first.left() if columns > 1 else first.width() + 1
+        step_y = _rect(_item(columns)).top() - first.top() if columns < count else first.height() + 1
+        if step_x <= 0 or step_y <= 0: return range(count)
+        # One cell of slack on each side; the exact check drops the extras
+        r0 = max(0, (rect.top() - first.top()) // step_y - 1)
+        r1 = (rect.bottom() - first.top()) // step_y + 1
+        c0 = max(0, (rect.left() - first.left()) // step_x - 1)
+        c1 = min(columns - 1, (rect.right() - first.left()) // step_x + 1)
+        cells = []
+        for r in range(r0, r1 + 1):
+            start = r * columns
+            if start >= count: break
+            cells.extend(range(start + c0, min(start + c1 + 1, count)))
+        return cells
+
     def startDrag(self, supportedActions):
         items = self.selectedItems()
         if not items: return
@@ -402,27 +526,50 @@ class ImageListWidget(QListWidget):
         drag.setMimeData(mime)
 
         size = self.iconSize()
+        pixmap = self._drag_preview(items, size)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(QPoint(size.width()//2, size.height()))
+        drag.exec(Qt.MoveAction)
+
+    def _drop_drag_cache(self):
+        self._drag_cache = None
+
+    def _drag_preview(self, items, size: QSize) -> QPixmap:
+        # The preview depends only on the first item's thumbnail, the count and the icon size
+        widget = self.itemWidget(items[0])
+        source = None
+        if widget and hasattr(widget, 'image_label'):
+            source = widget.image_label.pixmap()
+            if source is not None and source.isNull(): source = None
+        key = (self.row(items[0]), len(items), size.width(), size.height(),
+               source.cacheKey() if source is not None else 0)
+        cached = self._drag_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         pixmap = QPixmap(size)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
         
         # Draw first item
-        widget = self.itemWidget(items[0])
-        if widget and hasattr(widget, 'image_label') and widget.image_label.pixmap():
-            scaled = widget.image_label.pixmap().scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if source is not None:
+            # Ghosted and dimmed anyway; nearest-neighbour keeps drag start snappy
+            scaled = source.scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation)
             x = (size.width() - scaled.width()) // 2
             y = (size.height() - scaled.height()) // 2
+            # Target is freshly cleared, so a straight copy beats alpha blending
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
             painter.drawPixmap(x, y, scaled)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
 
         if len(items) > 1:
-            painter.fillRect(pixmap.rect(), QColor(0,0,0,128))
-            painter.setPen(QPen(Qt.white))
+            painter.fillRect(pixmap.rect(), self._DRAG_OVERLAY)
+            painter.setPen(self._DRAG_PEN)
             painter.drawText(pixmap.rect(), Qt.AlignCenter, str(len(items)))
         painter.end()
 
-        drag.setPixmap(pixmap)
-        drag.setHotSpot(QPoint(size.width()//2, size.height()))
-        drag.exec(Qt.MoveAction)
+        self._drag_cache = (key, pixmap)
+        return pixmap
 
 
 # ------------------------------------------------------------
@@ -438,19 +585,13 @@ class PannableScrollArea(QScrollArea):
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._dragging = True
-            if hasattr(event, 'position'):
-                self._last_pos = event.position().toPoint()
-            else:
-                self._last_pos = QPoint(event.x(), event.y())
+            self._last_pos = _epos(event)
             self.setCursor(Qt.ClosedHandCursor)
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self._dragging and self._last_pos is not None:
-            if hasattr(event, 'position'):
-                current_pos = event.position().toPoint()
-            else:
-                current_pos = QPoint(event.x(), event.y())
+            current_pos = _epos(event)
             delta = current_pos - self._last_pos
             self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
             self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
@@ -487,19 +628,29 @@ class GPUImageWidget(QGraphicsView):
         # GPU Viewport (Hardware Acceleration)
         # Note: If experiencing lag, try commenting this out to use software rendering
         # User reported lag -> Switching to Software Raster (often smoother for 2D Pan/Zoom on Windows)
-        # self.setViewport(QOpenGLWidget())
+        # self.setViewport(QOpenGLWidget())  # from PySide6.QtOpenGLWidgets import QOpenGLWidget
         
         # Scene
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
         self.pixmap_item = QGraphicsPixmapItem()
+        # Keep the rasterized item between paints; pans then only blit the cache
+        self.pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.addItem(self.pixmap_item)
         
         # Optimization Flags
         self.setRenderHint(QPainter.Antialiasing, False)
         self.setRenderHint(QPainter.SmoothPixmapTransform, False) # Bilinear is slow on CPU? Let's keep it off for speed for now.
         self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
-        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+
+        # Fast sampling while the wheel is moving, smooth once it rests.
+        # The pixmap item's transformation mode wins over the view render hint.
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(150)
+        self._smooth_timer.timeout.connect(self._go_smooth)
+        self.pixmap_item.setTransformationMode(Qt.SmoothTransformation) # at rest
         
         # UX: Anchor Under Mouse (CRITICAL for User Request "Zoom at Mouse Position")
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
@@ -513,20 +664,31 @@ class GPUImageWidget(QGraphicsView):
         self.setStyleSheet("background: transparent; border: none;")
         self._current_zoom = 1.0
         self._syncing = False
-        self._last_scroll_time = 0
+        self._scroll_clock = QElapsedTimer() # monotonic ms for the sync throttle
+        self._scroll_clock.start()
+        self._last_scroll_time = -16
+        self._last_emitted = (-1.0, -1.0) # rounded (x_pct, y_pct) last sent, for dedup only
+        # Trailing emit: a change swallowed by the throttle is sent once the window closes
+        self._scroll_trailing = QTimer(self)
+        self._scroll_trailing.setSingleShot(True)
+        self._scroll_trailing.timeout.connect(self._emit_scroll)
 
         # Connect Scrollbars for Sync Signal
-        self.horizontalScrollBar().valueChanged.connect(self._emit_scroll)
-        self.verticalScrollBar().valueChanged.connect(self._emit_scroll)
+        # valueChanged's int must not land in _emit_scroll's force flag
+        self.horizontalScrollBar().valueChanged.connect(lambda _: self._emit_scroll())
+        self.verticalScrollBar().valueChanged.connect(lambda _: self._emit_scroll())
 
     def _emit_scroll(self, force=False):
         if self._syncing: return
         
         # Throttle (e.g. max 60fps ~ 16ms)
-        import time
-        now = time.time() * 1000
-        if not force and now - self._last_scroll_time < 16:
+        now = self._scroll_clock.elapsed()
+        wait = 16 - (now - self._last_scroll_time)
+        if not force and wait > 0:
+            if not self._scroll_trailing.isActive():
+                self._scroll_trailing.start(wait)
             return
+        self._scroll_trailing.stop()
         self._last_scroll_time = now
 
         # Calculate percentage
@@ -536,6 +698,12 @@ class GPUImageWidget(QGraphicsView):
         x_pct = h.value() / h.maximum() if h.maximum() > 0 else 0
         y_pct = v.value() / v.maximum() if v.maximum() > 0 else 0
         
+        # Skip no-op syncs; forced ones (after a zoom) always go out.
+        # Rounded only for the comparison; the sibling gets the exact position.
+        pair = (round(x_pct, 4), round(y_pct, 4))
+        if not force and pair == self._last_emitted:
+            return
+        self._last_emitted = pair
         self.scrollChanged.emit(x_pct, y_pct)
 
     def set_scroll_pct(self, x_pct, y_pct):
@@ -547,6 +715,8 @@ class GPUImageWidget(QGraphicsView):
             h.setValue(int(x_pct * h.maximum()))
         if v.maximum() > 0:
             v.setValue(int(y_pct * v.maximum()))
+        # Sync moved this view; a later user scroll back to the old spot must still emit
+        self._last_emitted = (-1.0, -1.0)
         self._syncing = False
 
     def set_pixmap(self, pixmap: QPixmap | None):
@@ -554,7 +724,10 @@ class GPUImageWidget(QGraphicsView):
             self.pixmap_item.setPixmap(QPixmap())
             return
             
+        # Drop the old raster cache before swapping content
+        self.pixmap_item.setCacheMode(QGraphicsItem.NoCache)
         self.pixmap_item.setPixmap(pixmap)
+        self.pixmap_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.scene.setSceneRect(self.pixmap_item.boundingRect())
         self.fitInView(self.pixmap_item, Qt.KeepAspectRatio)
         # Capture the actual scale applied by fitInView
@@ -568,6 +741,7 @@ class GPUImageWidget(QGraphicsView):
         
         factor = 1.1 if delta > 0 else 0.9
         
+        self._go_fast()
         self.scale(factor, factor)
         
         # Update internal state with REAL scale
@@ -580,6 +754,15 @@ class GPUImageWidget(QGraphicsView):
         
         event.accept()
 
+    def _go_fast(self):
+        # Any zoom step: sample nearest-neighbour until zooming has been idle for a moment
+        if self.pixmap_item.transformationMode() != Qt.FastTransformation:
+            self.pixmap_item.setTransformationMode(Qt.FastTransformation)
+        self._smooth_timer.start()
+
+    def _go_smooth(self):
+        self.pixmap_item.setTransformationMode(Qt.SmoothTransformation)
+
     def set_zoom(self, value: int):
         # value is 10 to 300 (percentage)
         # Check current scale
@@ -590,6 +773,7 @@ class GPUImageWidget(QGraphicsView):
 
         # Apply relative scale
         ratio = target_level / current_level
+        self._go_fast()
         self.scale(ratio, ratio)
         
         self._current_zoom = target_level
@@ -607,6 +791,7 @@ class GPUImageWidget(QGraphicsView):
         current_level = self.transform().m11()
         if current_level > 0:
             ratio = factor / current_level
+            self._go_fast()
             self.scale(ratio, ratio)
             self._current_zoom = factor
         
@@ -39,6 +39,28 @@ TRANSLATIONS = {
         'tab_settings': '설정',
         'tab_preview': '미리보기',
         'tab_log': '로그',
+        'org_btn_scan': '스캔 시작',
+        'org_btn_start': '이동 시작',
+        'org_btn_close': '닫기',
+        'org_src_group': '원본 폴더 선택',
+        'org_dst_group': '타겟 폴더 선택',
+        'org_no_folder': '선택된 폴더 없음',
+        'org_settings': '설정',
+        'org_structure_hint': '폴더 구조 (드래그하여 순서 변경):',
+        'org_preview_path': '예상 경로: {path}',
+        'org_action': '작업:',
+        'org_copy': '복사 (Copy)',
+        'org_move': '이동 (Move)',
+        'org_dup_policy': '중복 처리:',
+        'org_policy_rename': '이름 변경 (Rename)',
+        'org_policy_skip': '건너뛰기 (Skip)',
+        'org_dedup': '중복 파일 건너뛰기 (해시)',
+        'struct_date': '날짜 (YYYY-MM-DD)',
+        'struct_camera': '카메라 모델',
+        'struct_kind': '파일 종류 (RAW/JPG)',
+        'struct_year': '연도 (YYYY)',
+        'struct_month': '월 (YYYY-MM)',
+        'struct_lens': '렌즈 모델',
         'pair_prompt_title': '파일 그룹화 감지',
         'pair_prompt_msg': '[분석 결과]\n\n📂 발견된 위치 ({folder_count}개 폴더):\n{folder_names} 등...\n\n- 페어 발견: {pairs}쌍\n- 페어 아님 (단독): {unpaired}개 파일\n\n이 {pairs}쌍의 파일들을 그룹화(Pairing) 하시겠습니까?'
     },
@@ -81,6 +103,28 @@ TRANSLATIONS = {
         'tab_settings': 'Settings',
         'tab_preview': 'Preview',
         'tab_log': 'Log',
+        'org_btn_scan': 'Start Scan',
+        'org_btn_start': 'Start Moving',
+        'org_btn_close': 'Close',
+        'org_src_group': 'Source Folder',
+        'org_dst_group': 'Target Folder',
+        'org_no_folder': 'No folder selected',
+        'org_settings': 'Settings',
+        'org_structure_hint': 'Folder structure (drag to reorder):',
+        'org_preview_path': 'Expected path: {path}',
+        'org_action': 'Action:',
+        'org_copy': 'Copy',
+        'org_move': 'Move',
+        'org_dup_policy': 'Duplicates:',
+        'org_policy_rename': 'Rename',
+        'org_policy_skip': 'Skip',
+        'org_dedup': 'Skip duplicate files (hash)',
+        'struct_date': 'Date (YYYY-MM-DD)',
+        'struct_camera': 'Camera Model',
+        'struct_kind': 'File Kind (RAW/JPG)',
+        'struct_year': 'Year (YYYY)',
+        'struct_month': 'Month (YYYY-MM)',
+        'struct_lens': 'Lens Model',
         'pair_prompt_title': 'Group Files Found',
         'pair_prompt_msg': '[Analysis Result]\n\n📂 Found in ({folder_count} folders):\n{folder_names} etc...\n\n- Pairs Found: {pairs}\n- Unpaired (Single): {unpaired} files\n\nDo you want to group these {pairs} pairs?'
     }
@@ -1,9 +1,22 @@
 import sys
+import multiprocessing
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 from .gui.main_window import GridSelectorWindow
+from .gui.styles import DARK_STYLE
+
+VIEWER_PIXMAP_CACHE_KB = 512 * 1024
+THUMB_PIXMAP_CACHE_KB = 128 * 1024
 
 def main():
+    # Sorter.scan uses a process pool; required for frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
+    # Holds the viewer's full-res pixmaps (KB; a 24MP image is ~96 MB decoded)
+    # plus smooth-scaled grid thumbnails
+    QPixmapCache.setCacheLimit(VIEWER_PIXMAP_CACHE_KB + THUMB_PIXMAP_CACHE_KB)
+    # Parsed once here and inherited by every window and dialog
+    app.setStyleSheet(DARK_STYLE)
     window = GridSelectorWindow()
     window.show()
     sys.exit(app.exec())